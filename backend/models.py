@@ -345,3 +345,7 @@ class AdminCreate(BaseModel):
     email: str
     password: str
     name: str
+
+class BulkDelete(BaseModel):
+    # Bounded so one request cannot build an unbounded $in query; empty lists are rejected with 422
+    ids: List[str] = Field(..., min_length=1, max_length=500)
@@ -13,7 +13,7 @@ from models import (
     PortfolioCreate, Portfolio, TestimonialCreate, Testimonial,
     FAQCreate, FAQ, AddOnCreate, AddOn,
     EmailTemplateCreate, EmailTemplate, StorageSettingsUpdate, InstagramSettingsUpdate,
-    QuestionnaireCreate, Questionnaire, PaymentSettings
+    QuestionnaireCreate, Questionnaire, PaymentSettings, BulkDelete
 )
 from routes.public import get_default_packages
 from services.email import send_booking_confirmation_email, send_manual_booking_email, send_email
@@ -86,6 +86,13 @@ async def admin_get_packages(admin=Depends(verify_token)):
         packages = defaults
     return packages
 
+@router.get("/admin/packages/{package_id}")
+async def admin_get_package(package_id: str, admin=Depends(verify_token)):
+    package = await db.packages.find_one({"id": package_id}, {"_id": 0})
+    if not package:
+        raise HTTPException(status_code=404, detail="Package not found")
+    return package
+
 @router.post("/admin/packages")
 async def admin_create_package(data: PackageCreate, admin=Depends(verify_token)):
     max_order_item = await db.packages.find_one(sort=[("order", -1)])
@@ -101,7 +108,8 @@ async def admin_update_package(package_id: str, data: PackageCreate, admin=Depen
     result = await db.packages.update_one({"id": package_id}, {"$set": update_data})
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Package not found")
-    return {"message": "Package updated"}
+    package = await db.packages.find_one({"id": package_id}, {"_id": 0})
+    return {"message": "Package updated", "package": package}
 
 @router.delete("/admin/packages/{package_id}")
 async def admin_delete_package(package_id: str, admin=Depends(verify_token)):
@@ -165,19 +173,21 @@ async def admin_update_booking(booking_id: str, data: BookingUpdate, admin=Depen
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Booking not found")
 
+    updated_booking = await db.bookings.find_one({"id": booking_id}, {"_id": 0})
+
     if date_or_time_changed and old_booking:
         # Delete old calendar event
         old_uid = old_booking.get("calendar_event_id")
         if old_uid:
             await delete_calendar_event(old_uid)
         # Create new calendar event with updated booking
-        updated_booking = await db.bookings.find_one({"id": booking_id}, {"_id": 0})
         if updated_booking:
             new_uid = await create_calendar_event(updated_booking)
             if new_uid:
                 await db.bookings.update_one({"id": booking_id}, {"$set": {"calendar_event_id": new_uid}})
+                updated_booking["calendar_event_id"] = new_uid
 
-    return {"message": "Booking updated"}
+    return {"message": "Booking updated", "booking": updated_booking}
 
 @router.delete("/admin/bookings/{booking_id}")
 async def admin_delete_booking(booking_id: str, admin=Depends(verify_token)):
@@ -194,6 +204,15 @@ async def admin_delete_booking(booking_id: str, admin=Depends(verify_token)):
     await db.bookings.delete_one({"id": booking_id})
     return {"message": "Booking deleted"}
 
+@router.post("/admin/bookings/bulk-delete")
+async def admin_bulk_delete_bookings(data: BulkDelete, admin=Depends(verify_token)):
+    bookings = await db.bookings.find({"id": {"$in": data.ids}}, {"_id": 0, "calendar_event_id": 1}).to_list(len(data.ids))
+    for booking in bookings:
+        if booking.get("calendar_event_id"):
+            await delete_calendar_event(booking["calendar_event_id"])
+    result = await db.bookings.delete_many({"id": {"$in": data.ids}})
+    return {"deleted": result.deleted_count}
+
 
 # ==================== ADMIN - CALENDAR VIEW ====================
 
@@ -424,6 +443,11 @@ async def admin_delete_portfolio(item_id: str, admin=Depends(verify_token)):
         raise HTTPException(status_code=404, detail="Item not found")
     return {"message": "Portfolio item deleted"}
 
+@router.post("/admin/portfolio/bulk-delete")
+async def admin_bulk_delete_portfolio(data: BulkDelete, admin=Depends(verify_token)):
+    result = await db.portfolio.delete_many({"id": {"$in": data.ids}})
+    return {"deleted": result.deleted_count}
+
 
 # ==================== ADMIN - TESTIMONIALS ====================
 
@@ -571,6 +595,13 @@ async def test_email_settings(data: dict, admin=Depends(verify_token)):
 async def admin_get_addons(admin=Depends(verify_token)):
     return await db.addons.find({}, {"_id": 0}).sort("order", 1).to_list(100)
 
+@router.get("/admin/addons/{addon_id}")
+async def admin_get_addon(addon_id: str, admin=Depends(verify_token)):
+    addon = await db.addons.find_one({"id": addon_id}, {"_id": 0})
+    if not addon:
+        raise HTTPException(status_code=404, detail="Add-on not found")
+    return addon
+
 @router.post("/admin/addons")
 async def admin_create_addon(data: AddOnCreate, admin=Depends(verify_token)):
     addon = AddOn(**data.model_dump())
@@ -593,6 +624,11 @@ async def admin_delete_addon(addon_id: str, admin=Depends(verify_token)):
         raise HTTPException(status_code=404, detail="Add-on not found")
     return {"message": "Add-on deleted"}
 
+@router.post("/admin/addons/bulk-delete")
+async def admin_bulk_delete_addons(data: BulkDelete, admin=Depends(verify_token)):
+    result = await db.addons.delete_many({"id": {"$in": data.ids}})
+    return {"deleted": result.deleted_count}
+
 
 # ==================== ADMIN - EMAIL TEMPLATES ====================
 
@@ -634,6 +670,11 @@ async def admin_delete_email_template(template_id: str, admin=Depends(verify_tok
         raise HTTPException(status_code=404, detail="Template not found")
     return {"message": "Template deleted"}
 
+@router.post("/admin/email-templates/bulk-delete")
+async def admin_bulk_delete_email_templates(data: BulkDelete, admin=Depends(verify_token)):
+    result = await db.email_templates.delete_many({"id": {"$in": data.ids}})
+    return {"deleted": result.deleted_count}
+
 
 # ==================== ADMIN - STORAGE / INSTAGRAM SETTINGS ====================
 
@@ -1,6 +1,7 @@
 import os
 import asyncio
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse
 from datetime import datetime, timezone, timedelta
 from db import db, SENDGRID_API_KEY, SENDER_EMAIL, logger
 from sendgrid import SendGridAPIClient
@@ -85,19 +86,27 @@ async def run_reminder_manually(data: dict, admin=Depends(verify_token)):
 
 # ==================== CRON ENDPOINTS ====================
 
+async def process_active_reminders(reminders: list) -> int:
+    total_sent = 0
+    for reminder in reminders:
+        if reminder.get("active", False):
+            sent = await process_reminder(reminder)
+            total_sent += sent
+    return total_sent
+
 @router.post("/cron/process-reminders")
-async def cron_process_reminders():
-    """Process all active reminders - called by background scheduler or manually"""
+async def cron_process_reminders(background_tasks: BackgroundTasks, run_async: bool = Query(False, alias="async")):
+    """Process all active reminders - called by background scheduler or manually.
+    With ?async=1 the work is queued and the request returns 202 straight away."""
     doc = await db.automated_reminders.find_one({"id": "default"}, {"_id": 0})
     if not doc:
         return {"message": "No reminders configured", "total_sent": 0}
 
-    total_sent = 0
-    for reminder in doc.get("reminders", []):
-        if reminder.get("active", False):
-            sent = await process_reminder(reminder)
-            total_sent += sent
+    if run_async:
+        background_tasks.add_task(process_active_reminders, doc.get("reminders", []))
+        return JSONResponse(status_code=202, content={"message": "Reminder processing queued"})
 
+    total_sent = await process_active_reminders(doc.get("reminders", []))
     return {"message": "Processed reminders", "total_sent": total_sent}
 
 @router.post("/cron/fetch-google-reviews")
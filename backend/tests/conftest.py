@@ -0,0 +1,410 @@
+"""
+Shared pytest configuration for the backend API tests
+- api_client: one pooled keep-alive requests session for the whole run
+- auth_token / auth_headers: admin login done once per run, token cached in .pytest_cache
+- authenticated_client: a separate pooled session with the admin Authorization header preset
+- cached_get: GET through api_client, memoised per URL + params for read-only tests
+- get_many: fetch several independent read-only URLs concurrently on a shared thread pool
+- loads / dumps / schema_validator: JSON helpers test modules import (orjson when installed, fastjsonschema lazily)
+- vcr_config: record/replay HTTP traffic with pytest-recording (tests marked @pytest.mark.vcr)
+- --mock: serve canned JSON from tests/fixtures instead of the live backend (modules using mock_backend);
+  FAQs, bookings and blocked slots are kept in memory so create/update/delete flows still hold
+"""
+import json
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import jwt
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    loads, dumps = orjson.loads, orjson.dumps
+except ImportError:  # orjson is optional; stdlib json parses and writes the same payloads
+    loads, dumps = json.loads, json.dumps
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://photo-biz-hub-3.preview.emergentagent.com').rstrip('/')
+
+
+def schema_validator(schema):
+    """Compile the schema on first use; without fastjsonschema only the tests that validate with it are skipped"""
+    compiled = None
+
+    def validate(data):
+        nonlocal compiled
+        if compiled is None:
+            compiled = pytest.importorskip("fastjsonschema").compile(schema)
+        return compiled(data)
+    return validate
+
+
+# Test credentials
+ADMIN_EMAIL = "admin@silwerlining.com"
+ADMIN_PASSWORD = "Admin123!"
+
+# Admin token is cached in .pytest_cache and reused until it is this close to expiry
+TOKEN_CACHE_KEY = "silwer_lining/admin_token"
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+# Fixtures that need a working admin login; once it fails, tests using them are skipped before setup
+AUTH_FIXTURES = {"auth_token", "auth_headers", "authenticated_client"}
+AUTH_FAILED_REASON = "Authentication failed - skipping authenticated tests"
+_auth_failed = False
+
+# Canned responses for --mock runs
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+MOCK_TOKEN = "mock-admin-token"
+
+# Connection pool per host and retries for dropped connections and gateway errors (idempotent methods only);
+# after the last retry the gateway response itself is returned so tests report the real status
+POOL_SIZE = 32
+RETRY = Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504), raise_on_status=False)
+
+# (connect, read) seconds applied to every request that does not pass its own timeout,
+# so a hung backend fails the test instead of waiting on the OS TCP timeout
+DEFAULT_TIMEOUT = (3, 30)
+
+# Threads shared by the concurrent GET helpers; stays below POOL_SIZE so none waits on a connection
+THREAD_POOL_WORKERS = 8
+
+# LIVE=1 re-records every cassette against the real backend; otherwise existing cassettes are replayed
+LIVE = os.environ.get("LIVE") == "1"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--mock", action="store_true", default=False,
+                     help="Serve canned JSON instead of hitting the backend (needs the responses package)")
+    parser.addoption("--run-exploratory", action="store_true", default=False,
+                     help="Also run @pytest.mark.exploratory tests, which probe data but cannot fail")
+
+
+def pytest_configure(config):
+    if config.getoption("--mock"):
+        # Test modules read the URL at import time; give them the host the mocks are registered on
+        os.environ.setdefault("REACT_APP_BACKEND_URL", BASE_URL)
+
+
+def pytest_collection_modifyitems(config, items):
+    mock = config.getoption("--mock")
+    run_exploratory = config.getoption("--run-exploratory")
+    skip_live = pytest.mark.skip(reason="needs the live backend (integration) - run without --mock")
+    skip_exploratory = pytest.mark.skip(reason="exploratory; enable with --run-exploratory")
+    for item in items:
+        if not run_exploratory and item.get_closest_marker("exploratory"):
+            item.add_marker(skip_exploratory)
+        elif mock and (item.get_closest_marker("integration") or "mock_backend" not in item.fixturenames):
+            item.add_marker(skip_live)
+
+
+def pytest_runtest_setup(item):
+    # Skip up front rather than resolving every dependent fixture only to hit the failed login again
+    if _auth_failed and AUTH_FIXTURES & set(item.fixturenames):
+        pytest.skip(AUTH_FAILED_REASON)
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=DEFAULT_TIMEOUT if timeout is None else timeout, **kwargs)
+
+
+def _pooled_session():
+    """JSON requests session with a connection pool deep enough for the concurrent cleanup helpers"""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = _TimeoutAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Shared requests session so every test reuses pooled keep-alive connections (no auth header)"""
+    session = _pooled_session()
+    yield session
+    session.close()
+
+
+def _login(api_client, config):
+    """Log in as admin and cache the token (with its JWT expiry) for later runs"""
+    response = api_client.post(f"{BASE_URL}/api/admin/login", json={
+        "email": ADMIN_EMAIL,
+        "password": ADMIN_PASSWORD
+    })
+    if response.status_code != 200:
+        config.cache.set(TOKEN_CACHE_KEY, None)
+        return None
+    token = response.json().get("token")
+    exp = jwt.decode(token, options={"verify_signature": False}).get("exp", 0)
+    config.cache.set(TOKEN_CACHE_KEY, {"base_url": BASE_URL, "token": token, "exp": exp})
+    return token
+
+
+@pytest.fixture(scope="session")
+def refresh_auth_token(api_client, pytestconfig):
+    """Force a fresh admin login, for tests that find the cached token rejected"""
+    return lambda: _login(api_client, pytestconfig)
+
+
+@pytest.fixture(scope="session")
+def auth_token(api_client, pytestconfig):
+    """Admin token for the whole run, reusing a cached one until near expiry"""
+    if pytestconfig.getoption("--mock"):
+        return MOCK_TOKEN
+    cached = pytestconfig.cache.get(TOKEN_CACHE_KEY, None)
+    if (cached and cached.get("base_url") == BASE_URL
+            and cached.get("exp", 0) - time.time() > TOKEN_EXPIRY_MARGIN_SECONDS):
+        return cached["token"]
+    global _auth_failed
+    token = _login(api_client, pytestconfig)
+    if token:
+        return token
+    _auth_failed = True
+    pytest.skip(AUTH_FAILED_REASON)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_token):
+    """Authorization header for admin endpoints"""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture(scope="session")
+def authenticated_client(auth_headers, pytestconfig):
+    """Admin session with its own connections; api_client never gets the Authorization header"""
+    session = _pooled_session()
+    session.headers.update(auth_headers)
+
+    def drop_rejected_token(response, *args, **kwargs):
+        # A revoked or rotated token must not be served from the cache to the next run
+        if response.status_code == 401:
+            pytestconfig.cache.set(TOKEN_CACHE_KEY, None)
+
+    session.hooks["response"].append(drop_rejected_token)
+    yield session
+    session.close()
+
+
+class _GetCache:
+    """Successful GET responses kept for the whole run; writers drop stale entries with invalidate()"""
+
+    def __init__(self, session):
+        self.session = session
+        self.responses = {}
+
+    def __call__(self, url, params=None):
+        key = (url, tuple(sorted((params or {}).items())))
+        if key not in self.responses:
+            response = self.session.get(url, params=params)
+            if response.status_code != 200:
+                return response
+            self.responses[key] = response
+        return self.responses[key]
+
+    def invalidate(self, url_prefix):
+        for key in [key for key in self.responses if key[0].startswith(url_prefix)]:
+            del self.responses[key]
+
+
+@pytest.fixture(scope="session")
+def cached_get(api_client):
+    """Memoised public GET for endpoints whose data does not change during the run"""
+    return _GetCache(api_client)
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """One executor for the run instead of spinning threads up per test"""
+    with ThreadPoolExecutor(max_workers=THREAD_POOL_WORKERS) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="session")
+def get_many(cached_get, thread_pool):
+    """GET independent read-only URLs concurrently through cached_get; returns {url: parsed JSON}"""
+    def fetch(urls):
+        responses = dict(zip(urls, thread_pool.map(cached_get, urls)))
+        for url, response in responses.items():
+            assert response.status_code == 200, f"GET {url} returned {response.status_code}"
+        return {url: response.json() for url, response in responses.items()}
+    return fetch
+
+
+def _load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name)) as f:
+        return json.load(f)
+
+
+def _route(path):
+    """Match an API path on BASE_URL; {id} segments match any single path component"""
+    return re.compile(re.escape(f"{BASE_URL}/api{path}").replace(r"\{id\}", "[^/?]+") + r"(\?.*)?$")
+
+
+def _requires_auth(handler):
+    """Mirror HTTPBearer: 403 when the Authorization header is missing"""
+    def callback(request):
+        if "Authorization" not in request.headers:
+            return 403, {}, json.dumps({"detail": "Not authenticated"})
+        return handler(request)
+    return callback
+
+
+def _json_reply(body, status=200):
+    return lambda request: (status, {}, json.dumps(body))
+
+
+def _query(request):
+    return {key: values[0] for key, values in parse_qs(urlparse(request.url).query).items()}
+
+
+def _last_segment(request):
+    return urlparse(request.url).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+@pytest.fixture(scope="session")
+def mock_backend(pytestconfig):
+    """With --mock, answer API calls from tests/fixtures; otherwise a no-op and tests hit BASE_URL"""
+    if not pytestconfig.getoption("--mock"):
+        yield None
+        return
+    responses = pytest.importorskip("responses")
+    blocked_slot_ids = set()
+    faqs = {faq["id"]: faq for faq in _load_fixture("faqs.json")}
+    questionnaires = {"maternity": _load_fixture("questionnaire_maternity.json")}
+    booking_settings = _load_fixture("booking_settings.json")
+    bookings = {}
+
+    def create_blocked_slot(request):
+        slot_id = str(uuid.uuid4())
+        blocked_slot_ids.add(slot_id)
+        return 200, {}, json.dumps({"message": "Slot blocked", "id": slot_id})
+
+    def delete_blocked_slot(request):
+        slot_id = _last_segment(request)
+        if slot_id not in blocked_slot_ids:
+            return 404, {}, json.dumps({"detail": "Blocked slot not found"})
+        blocked_slot_ids.discard(slot_id)
+        return 200, {}, json.dumps({"message": "Slot unblocked"})
+
+    def list_faqs(request):
+        category = _query(request).get("category")
+        active = [faq for faq in faqs.values() if faq["active"] and (not category or faq["category"] == category)]
+        return 200, {}, json.dumps(sorted(active, key=lambda faq: faq["order"]))
+
+    def create_faq(request):
+        faq = {"category": "general", "active": True, "order": 0, **json.loads(request.body),
+               "id": str(uuid.uuid4())}
+        faqs[faq["id"]] = faq
+        return 200, {}, json.dumps(faq)
+
+    def update_faq(request):
+        faq_id = _last_segment(request)
+        if faq_id not in faqs:
+            return 404, {}, json.dumps({"detail": "FAQ not found"})
+        faqs[faq_id].update(json.loads(request.body))
+        return 200, {}, json.dumps({"message": "FAQ updated"})
+
+    def delete_faq(request):
+        if faqs.pop(_last_segment(request), None) is None:
+            return 404, {}, json.dumps({"detail": "FAQ not found"})
+        return 200, {}, json.dumps({"message": "FAQ deleted"})
+
+    def public_questionnaire(request):
+        questionnaire = questionnaires.get(_last_segment(request))
+        if not questionnaire or not questionnaire["active"]:
+            return 200, {}, json.dumps({"questions": []})
+        return 200, {}, json.dumps(questionnaire)
+
+    def admin_questionnaire(request):
+        session_type = _last_segment(request)
+        empty = {"session_type": session_type, "title": "", "description": "", "questions": [], "active": False}
+        return 200, {}, json.dumps(questionnaires.get(session_type, empty))
+
+    def available_times(request):
+        query = _query(request)
+        body = {"date": query.get("date"), "available_times": booking_settings["time_slots"]}
+        if "session_type" in query:
+            body["session_type"] = query["session_type"]
+        return 200, {}, json.dumps(body)
+
+    def create_booking(request):
+        booking = {**json.loads(request.body), "id": str(uuid.uuid4()), "status": "pending"}
+        bookings[booking["id"]] = booking
+        return 200, {}, json.dumps(booking)
+
+    def get_booking(request):
+        booking = bookings.get(_last_segment(request))
+        if booking is None:
+            return 404, {}, json.dumps({"detail": "Booking not found"})
+        return 200, {}, json.dumps(booking)
+
+    def list_bookings(request):
+        return 200, {}, json.dumps(list(bookings.values()))
+
+    def delete_booking(request):
+        bookings.pop(_last_segment(request), None)
+        return 200, {}, json.dumps({"message": "Booking deleted"})
+
+    routes = [
+        ("POST", "/admin/login", _json_reply({"token": MOCK_TOKEN, "name": "Admin", "email": ADMIN_EMAIL})),
+        ("GET", "/contract", _json_reply(_load_fixture("contract.json"))),
+        ("GET", "/admin/contract", _requires_auth(_json_reply(_load_fixture("contract.json")))),
+        ("GET", "/admin/calendar-view", _requires_auth(_json_reply(_load_fixture("calendar_view.json")))),
+        ("POST", "/admin/blocked-slots", _requires_auth(create_blocked_slot)),
+        ("DELETE", "/admin/blocked-slots/{id}", _requires_auth(delete_blocked_slot)),
+        ("POST", "/admin/manual-booking", _requires_auth(_json_reply(_load_fixture("manual_booking.json")))),
+        ("DELETE", "/admin/bookings/{id}", _requires_auth(delete_booking)),
+        ("GET", "/booking-token/{id}", _json_reply({"detail": "Invalid or expired booking link"}, status=404)),
+        ("GET", "/faqs", list_faqs),
+        ("GET", "/admin/faqs", _requires_auth(lambda request: (200, {}, json.dumps(list(faqs.values()))))),
+        ("POST", "/admin/faqs", _requires_auth(create_faq)),
+        ("PUT", "/admin/faqs/{id}", _requires_auth(update_faq)),
+        ("DELETE", "/admin/faqs/{id}", _requires_auth(delete_faq)),
+        ("GET", "/questionnaire/{id}", public_questionnaire),
+        ("GET", "/admin/questionnaires", _requires_auth(_json_reply(list(questionnaires.values())))),
+        ("GET", "/admin/questionnaires/{id}", _requires_auth(admin_questionnaire)),
+        ("GET", "/packages", _json_reply(_load_fixture("packages.json"))),
+        ("GET", "/booking-settings", _json_reply(booking_settings)),
+        ("GET", "/bookings/available-times", available_times),
+        ("POST", "/bookings", create_booking),
+        ("GET", "/admin/bookings", _requires_auth(list_bookings)),
+        ("GET", "/admin/bookings/{id}", _requires_auth(get_booking)),
+    ]
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        for method, path, callback in routes:
+            rsps.add_callback(method, _route(path), callback=callback, content_type="application/json")
+        yield rsps
+
+
+# Query params built from datetime.now() (e.g. available-times?date=); ignored when matching
+# cassettes so a recording still replays on a later day
+VOLATILE_QUERY_PARAMS = {"date"}
+
+
+def _query_without_dates(r1, r2):
+    def stable(request):
+        return [(key, value) for key, value in request.query if key not in VOLATILE_QUERY_PARAMS]
+    assert stable(r1) == stable(r2)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_recording_configure(config, vcr):
+    vcr.register_matcher("query_without_dates", _query_without_dates)
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Cassette settings for pytest-recording; auth headers are never written to disk.
+    Request bodies are not matched (vcrpy's default), so uuid-named payloads replay too"""
+    return {
+        "filter_headers": ["authorization"],
+        "record_mode": "all" if LIVE else "once",
+        "match_on": ["method", "scheme", "host", "port", "path", "query_without_dates"],
+    }
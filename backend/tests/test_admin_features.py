@@ -2,82 +2,91 @@
 Test suite for Silwer Lining Photography Admin Features
 Tests: Admin login, Packages CRUD, Booking Settings, Calendar Settings, Bookings Management
 """
+import logging
 import pytest
-import requests
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+from conftest import loads
+
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://photo-biz-hub-3.preview.emergentagent.com').rstrip('/')
 
 # Test credentials
 ADMIN_EMAIL = "admin@silwerlining.com"
 ADMIN_PASSWORD = "Admin123!"
 
+# Number of concurrent DELETEs issued when cleaning up TEST_ data
+CLEANUP_WORKERS = 8
+
+log = logging.getLogger(__name__)
+
+# Item URLs of every row this module creates; cleanup deletes exactly these, never a TEST_ prefix
+# sweep, which would also hit rows other modules' xdist workers are still using
+_created = []
+
+
+def _record(collection_url, response):
+    """Remember the row a create call made so module cleanup can delete it"""
+    if response.status_code == 200:
+        _created.append(f"{collection_url}/{loads(response.content)['id']}")
+    return response
+
 
+@pytest.mark.vcr
 class TestAdminAuth:
     """Admin authentication tests"""
     
-    def test_admin_login_success(self):
+    def test_admin_login_success(self, api_client):
         """Test admin login with valid credentials"""
-        response = requests.post(f"{BASE_URL}/api/admin/login", json={
+        response = api_client.post(f"{BASE_URL}/api/admin/login", json={
             "email": ADMIN_EMAIL,
             "password": ADMIN_PASSWORD
         })
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "token" in data
         assert "name" in data
         assert "email" in data
         assert data["email"] == ADMIN_EMAIL
         assert len(data["token"]) > 0
     
-    def test_admin_login_invalid_credentials(self):
+    def test_admin_login_invalid_credentials(self, api_client):
         """Test admin login with invalid credentials"""
-        response = requests.post(f"{BASE_URL}/api/admin/login", json={
+        response = api_client.post(f"{BASE_URL}/api/admin/login", json={
             "email": "wrong@example.com",
             "password": "wrongpassword"
         })
         assert response.status_code == 401
     
-    def test_admin_me_with_valid_token(self, auth_token):
+    def test_admin_me_with_valid_token(self, api_client, auth_token, refresh_auth_token):
         """Test /admin/me endpoint with valid token"""
-        response = requests.get(f"{BASE_URL}/api/admin/me", headers={
+        response = api_client.get(f"{BASE_URL}/api/admin/me", headers={
             "Authorization": f"Bearer {auth_token}"
         })
+        if response.status_code == 401:
+            # Cached token was rejected (e.g. JWT secret rotated) - log in again once
+            auth_token = refresh_auth_token()
+            response = api_client.get(f"{BASE_URL}/api/admin/me", headers={
+                "Authorization": f"Bearer {auth_token}"
+            })
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "name" in data
         assert "email" in data
     
-    def test_admin_me_without_token(self):
+    def test_admin_me_without_token(self, api_client):
         """Test /admin/me endpoint without token"""
-        response = requests.get(f"{BASE_URL}/api/admin/me")
+        response = api_client.get(f"{BASE_URL}/api/admin/me")
         assert response.status_code in [401, 403]
 
 
+@pytest.mark.vcr
 class TestPackagesManagement:
     """Packages CRUD tests"""
     
-    def test_get_admin_packages(self, auth_token):
-        """Test fetching packages list"""
-        response = requests.get(f"{BASE_URL}/api/admin/packages", headers={
-            "Authorization": f"Bearer {auth_token}"
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Should have default packages seeded
-        assert len(data) > 0
-        # Verify package structure
-        if len(data) > 0:
-            pkg = data[0]
-            assert "id" in pkg
-            assert "name" in pkg
-            assert "session_type" in pkg
-            assert "price" in pkg
-            assert "duration" in pkg
-    
-    def test_create_package(self, auth_token):
+    def test_create_package(self, api_client, auth_token):
         """Test creating a new package"""
         package_data = {
             "name": "TEST_Premium Package",
@@ -89,18 +98,19 @@ class TestPackagesManagement:
             "popular": False,
             "active": True
         }
-        response = requests.post(f"{BASE_URL}/api/admin/packages", 
+        response = _record(f"{BASE_URL}/api/admin/packages", api_client.post(f"{BASE_URL}/api/admin/packages",
             json=package_data,
             headers={"Authorization": f"Bearer {auth_token}"}
-        )
+        ))
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert data["name"] == package_data["name"]
         assert data["price"] == package_data["price"]
         assert "id" in data
         return data["id"]
     
-    def test_update_package(self, auth_token):
+    @pytest.mark.slow
+    def test_update_package(self, api_client, auth_token):
         """Test updating a package"""
         # First create a package
         create_data = {
@@ -113,12 +123,12 @@ class TestPackagesManagement:
             "popular": False,
             "active": True
         }
-        create_response = requests.post(f"{BASE_URL}/api/admin/packages",
+        create_response = _record(f"{BASE_URL}/api/admin/packages", api_client.post(f"{BASE_URL}/api/admin/packages",
             json=create_data,
             headers={"Authorization": f"Bearer {auth_token}"}
-        )
+        ))
         assert create_response.status_code == 200
-        package_id = create_response.json()["id"]
+        package_id = loads(create_response.content)["id"]
         
         # Update the package
         update_data = {
@@ -131,23 +141,19 @@ class TestPackagesManagement:
             "popular": True,
             "active": True
         }
-        update_response = requests.put(f"{BASE_URL}/api/admin/packages/{package_id}",
+        update_response = api_client.put(f"{BASE_URL}/api/admin/packages/{package_id}",
             json=update_data,
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert update_response.status_code == 200
+        assert update_response.status_code in (200, 204)
         
-        # Verify update by fetching packages
-        get_response = requests.get(f"{BASE_URL}/api/admin/packages",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
-        packages = get_response.json()
-        updated_pkg = next((p for p in packages if p["id"] == package_id), None)
-        assert updated_pkg is not None
+        # Verify update
+        updated_pkg = _updated_entity(api_client, update_response, "package",
+            f"{BASE_URL}/api/admin/packages/{package_id}", auth_token)
         assert updated_pkg["name"] == update_data["name"]
         assert updated_pkg["price"] == update_data["price"]
     
-    def test_delete_package(self, auth_token):
+    def test_delete_package(self, api_client, auth_token):
         """Test deleting a package"""
         # First create a package to delete
         create_data = {
@@ -160,49 +166,31 @@ class TestPackagesManagement:
             "popular": False,
             "active": True
         }
-        create_response = requests.post(f"{BASE_URL}/api/admin/packages",
+        create_response = _record(f"{BASE_URL}/api/admin/packages", api_client.post(f"{BASE_URL}/api/admin/packages",
             json=create_data,
             headers={"Authorization": f"Bearer {auth_token}"}
-        )
+        ))
         assert create_response.status_code == 200
-        package_id = create_response.json()["id"]
+        package_id = loads(create_response.content)["id"]
         
         # Delete the package
-        delete_response = requests.delete(f"{BASE_URL}/api/admin/packages/{package_id}",
+        delete_response = api_client.delete(f"{BASE_URL}/api/admin/packages/{package_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert delete_response.status_code == 200
         
         # Verify deletion
-        get_response = requests.get(f"{BASE_URL}/api/admin/packages",
+        get_response = api_client.get(f"{BASE_URL}/api/admin/packages/{package_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        packages = get_response.json()
-        deleted_pkg = next((p for p in packages if p["id"] == package_id), None)
-        assert deleted_pkg is None
+        assert get_response.status_code == 404
 
 
+@pytest.mark.vcr
 class TestBookingSettings:
     """Booking settings tests"""
     
-    def test_get_booking_settings(self, auth_token):
-        """Test fetching booking settings"""
-        response = requests.get(f"{BASE_URL}/api/admin/booking-settings",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        # Verify settings structure
-        assert "available_days" in data
-        assert "time_slots" in data
-        assert "buffer_minutes" in data
-        assert "min_lead_days" in data
-        assert "max_advance_days" in data
-        assert "blocked_dates" in data
-        assert isinstance(data["available_days"], list)
-        assert isinstance(data["time_slots"], list)
-    
-    def test_update_booking_settings(self, auth_token):
+    def test_update_booking_settings(self, api_client, auth_token):
         """Test updating booking settings"""
         settings_data = {
             "available_days": [1, 2, 3, 4, 5, 6],  # Mon-Sat
@@ -214,47 +202,48 @@ class TestBookingSettings:
             "weekend_surcharge": 600,
             "session_duration_default": 90
         }
-        response = requests.put(f"{BASE_URL}/api/admin/booking-settings",
+        response = api_client.put(f"{BASE_URL}/api/admin/booking-settings",
             json=settings_data,
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert response.status_code == 200
         
         # Verify update
-        get_response = requests.get(f"{BASE_URL}/api/admin/booking-settings",
+        get_response = api_client.get(f"{BASE_URL}/api/admin/booking-settings",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert get_response.status_code == 200
-        data = get_response.json()
+        data = loads(get_response.content)
         assert data["buffer_minutes"] == 45
         assert data["min_lead_days"] == 2
         assert 6 in data["available_days"]  # Saturday added
     
-    def test_public_booking_settings(self):
+    def test_public_booking_settings(self, api_client):
         """Test public booking settings endpoint"""
-        response = requests.get(f"{BASE_URL}/api/booking-settings")
+        response = api_client.get(f"{BASE_URL}/api/booking-settings")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "available_days" in data
         assert "time_slots" in data
 
 
+@pytest.mark.vcr
 class TestCalendarSettings:
     """Calendar sync settings tests"""
     
-    def test_get_calendar_settings(self, auth_token):
+    def test_get_calendar_settings(self, api_client, auth_token):
         """Test fetching calendar settings"""
-        response = requests.get(f"{BASE_URL}/api/admin/calendar-settings",
+        response = api_client.get(f"{BASE_URL}/api/admin/calendar-settings",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         # Verify structure
         assert "apple_calendar_url" in data or "sync_enabled" in data
         # Password should not be returned
         assert "apple_calendar_password" not in data
     
-    def test_update_calendar_settings(self, auth_token):
+    def test_update_calendar_settings(self, api_client, auth_token):
         """Test updating calendar settings"""
         settings_data = {
             "apple_calendar_url": "https://caldav.icloud.com",
@@ -262,110 +251,71 @@ class TestCalendarSettings:
             "apple_calendar_password": "test-app-password",
             "sync_enabled": True
         }
-        response = requests.put(f"{BASE_URL}/api/admin/calendar-settings",
+        response = api_client.put(f"{BASE_URL}/api/admin/calendar-settings",
             json=settings_data,
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert response.status_code == 200
         
         # Verify update (password should not be returned)
-        get_response = requests.get(f"{BASE_URL}/api/admin/calendar-settings",
+        get_response = api_client.get(f"{BASE_URL}/api/admin/calendar-settings",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        data = get_response.json()
+        data = loads(get_response.content)
         assert data["sync_enabled"] == True
         assert data["apple_calendar_user"] == "test@icloud.com"
     
-    def test_calendar_sync_trigger(self, auth_token):
+    def test_calendar_sync_trigger(self, api_client, auth_token):
         """Test triggering calendar sync (MOCKED - returns success but doesn't actually sync)"""
-        response = requests.post(f"{BASE_URL}/api/admin/calendar/sync",
+        response = api_client.post(f"{BASE_URL}/api/admin/calendar/sync",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         # Should return 200 with pending_implementation status
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "message" in data
 
 
+@pytest.mark.vcr
 class TestBookingsManagement:
     """Bookings management tests"""
     
-    def test_get_admin_bookings(self, auth_token):
+    def test_get_admin_bookings(self, api_client, auth_token):
         """Test fetching all bookings"""
-        response = requests.get(f"{BASE_URL}/api/admin/bookings",
+        response = api_client.get(f"{BASE_URL}/api/admin/bookings",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert isinstance(data, list)
     
-    def test_create_and_manage_booking(self, auth_token):
+    @pytest.mark.slow
+    def test_create_and_manage_booking(self, api_client, auth_token, fresh_booking):
         """Test creating a booking and managing it"""
-        # Create a booking via public endpoint
-        tomorrow = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
-        booking_data = {
-            "client_name": "TEST_John Doe",
-            "client_email": "test_john@example.com",
-            "client_phone": "0123456789",
-            "session_type": "maternity",
-            "package_id": "mat-signature",
-            "package_name": "Signature",
-            "package_price": 5500,
-            "booking_date": tomorrow,
-            "booking_time": "10:00",
-            "notes": "Test booking for admin management"
-        }
-        create_response = requests.post(f"{BASE_URL}/api/bookings", json=booking_data)
-        assert create_response.status_code == 200
-        booking = create_response.json()
-        booking_id = booking["id"]
-        
         # Verify booking appears in admin list
-        list_response = requests.get(f"{BASE_URL}/api/admin/bookings",
+        list_response = api_client.get(f"{BASE_URL}/api/admin/bookings",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        bookings = list_response.json()
-        created_booking = next((b for b in bookings if b["id"] == booking_id), None)
+        bookings = loads(list_response.content)
+        created_booking = next((b for b in bookings if b["id"] == fresh_booking), None)
         assert created_booking is not None
         assert created_booking["status"] == "pending"
         
         # Update booking status to confirmed
-        update_response = requests.put(f"{BASE_URL}/api/admin/bookings/{booking_id}",
+        update_response = api_client.put(f"{BASE_URL}/api/admin/bookings/{fresh_booking}",
             json={"status": "confirmed"},
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert update_response.status_code == 200
+        assert update_response.status_code in (200, 204)
         
         # Verify status update
-        get_response = requests.get(f"{BASE_URL}/api/admin/bookings/{booking_id}",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
-        assert get_response.status_code == 200
-        updated_booking = get_response.json()
+        updated_booking = _updated_entity(api_client, update_response, "booking",
+            f"{BASE_URL}/api/admin/bookings/{fresh_booking}", auth_token)
         assert updated_booking["status"] == "confirmed"
-        
-        return booking_id
     
-    def test_update_booking_details(self, auth_token):
+    @pytest.mark.slow
+    def test_update_booking_details(self, api_client, auth_token, fresh_booking):
         """Test updating booking details"""
-        # Create a booking first
-        tomorrow = (datetime.now() + timedelta(days=6)).strftime("%Y-%m-%d")
-        booking_data = {
-            "client_name": "TEST_Jane Smith",
-            "client_email": "test_jane@example.com",
-            "client_phone": "0987654321",
-            "session_type": "newborn",
-            "package_id": "new-complete",
-            "package_name": "Complete Collection",
-            "package_price": 7000,
-            "booking_date": tomorrow,
-            "booking_time": "14:00",
-            "notes": "Original notes"
-        }
-        create_response = requests.post(f"{BASE_URL}/api/bookings", json=booking_data)
-        assert create_response.status_code == 200
-        booking_id = create_response.json()["id"]
-        
         # Update multiple fields
         update_data = {
             "client_name": "TEST_Jane Smith-Updated",
@@ -374,131 +324,148 @@ class TestBookingsManagement:
             "admin_notes": "Admin added this note",
             "status": "confirmed"
         }
-        update_response = requests.put(f"{BASE_URL}/api/admin/bookings/{booking_id}",
+        update_response = api_client.put(f"{BASE_URL}/api/admin/bookings/{fresh_booking}",
             json=update_data,
             headers={"Authorization": f"Bearer {auth_token}"}
         )
-        assert update_response.status_code == 200
+        assert update_response.status_code in (200, 204)
         
         # Verify updates
-        get_response = requests.get(f"{BASE_URL}/api/admin/bookings/{booking_id}",
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
-        updated = get_response.json()
+        updated = _updated_entity(api_client, update_response, "booking",
+            f"{BASE_URL}/api/admin/bookings/{fresh_booking}", auth_token)
         assert updated["client_name"] == "TEST_Jane Smith-Updated"
         assert updated["client_phone"] == "0111222333"
         assert updated["booking_time"] == "15:00"
         assert updated["admin_notes"] == "Admin added this note"
     
-    def test_delete_booking(self, auth_token):
+    @pytest.mark.slow
+    def test_delete_booking(self, api_client, auth_token, fresh_booking):
         """Test deleting a booking"""
-        # Create a booking to delete
-        tomorrow = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-        booking_data = {
-            "client_name": "TEST_Delete Me",
-            "client_email": "test_delete@example.com",
-            "client_phone": "0000000000",
-            "session_type": "studio",
-            "package_id": "studio-mini",
-            "package_name": "Mini Session",
-            "package_price": 2500,
-            "booking_date": tomorrow,
-            "booking_time": "09:00",
-            "notes": "To be deleted"
-        }
-        create_response = requests.post(f"{BASE_URL}/api/bookings", json=booking_data)
-        assert create_response.status_code == 200
-        booking_id = create_response.json()["id"]
-        
-        # Delete the booking
-        delete_response = requests.delete(f"{BASE_URL}/api/admin/bookings/{booking_id}",
+        delete_response = api_client.delete(f"{BASE_URL}/api/admin/bookings/{fresh_booking}",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert delete_response.status_code == 200
         
         # Verify deletion
-        get_response = requests.get(f"{BASE_URL}/api/admin/bookings/{booking_id}",
+        get_response = api_client.get(f"{BASE_URL}/api/admin/bookings/{fresh_booking}",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert get_response.status_code == 404
 
 
-class TestAdminStats:
-    """Admin dashboard stats tests"""
+@pytest.mark.vcr
+class TestAdminEndpointStructure:
+    """Structure checks for admin GET endpoints (packages, booking settings, stats)"""
     
-    def test_get_admin_stats(self, auth_token):
-        """Test fetching admin dashboard stats"""
-        response = requests.get(f"{BASE_URL}/api/admin/stats",
+    @pytest.mark.parametrize("path, expected_fields", [
+        pytest.param("/api/admin/packages", {
+            "id": str, "name": str, "session_type": str, "price": (int, float), "duration": str
+        }, id="packages"),
+        pytest.param("/api/admin/booking-settings", {
+            "available_days": list, "time_slots": list, "buffer_minutes": int,
+            "min_lead_days": int, "max_advance_days": int, "blocked_dates": list
+        }, id="booking-settings"),
+        pytest.param("/api/admin/stats", {
+            "total_bookings": int, "pending_bookings": int, "confirmed_bookings": int,
+            "completed_bookings": int, "portfolio_count": int, "testimonials_count": int,
+            "unread_messages": int, "packages_count": int
+        }, id="stats"),
+    ])
+    def test_admin_endpoint_structure(self, api_client, auth_token, path, expected_fields):
+        """Test admin GET endpoint returns the expected fields (first item for lists)"""
+        response = api_client.get(f"{BASE_URL}{path}",
             headers={"Authorization": f"Bearer {auth_token}"}
         )
         assert response.status_code == 200
-        data = response.json()
-        # Verify stats structure
-        assert "total_bookings" in data
-        assert "pending_bookings" in data
-        assert "confirmed_bookings" in data
-        assert "completed_bookings" in data
-        assert "portfolio_count" in data
-        assert "testimonials_count" in data
-        assert "unread_messages" in data
-        assert "packages_count" in data
+        data = loads(response.content)
+        if isinstance(data, list):
+            # Lists (e.g. default packages) should be seeded
+            assert len(data) > 0
+            data = data[0]
+        for field, kind in expected_fields.items():
+            assert field in data, f"{path} missing '{field}'"
+            assert isinstance(data[field], kind), f"{path} '{field}' has unexpected type {type(data[field]).__name__}"
 
 
+@pytest.mark.vcr
 class TestAvailableTimes:
     """Available times endpoint tests"""
     
-    def test_get_available_times(self):
+    def test_get_available_times(self, api_client, booking_date):
         """Test getting available times for a date"""
         # Use a date 5 days from now
-        future_date = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
-        response = requests.get(f"{BASE_URL}/api/bookings/available-times?date={future_date}")
+        response = api_client.get(f"{BASE_URL}/api/bookings/available-times?date={booking_date}")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "date" in data
         assert "available_times" in data
         assert isinstance(data["available_times"], list)
 
 
+def _updated_entity(client, update_response, key, url, auth_token):
+    """Entity echoed by an admin PUT; only falls back to a GET if the server sent nothing back"""
+    if update_response.status_code != 204:
+        entity = loads(update_response.content).get(key)
+        if entity:
+            return entity
+    get_response = client.get(url, headers={"Authorization": f"Bearer {auth_token}"})
+    assert get_response.status_code == 200
+    return loads(get_response.content)
+
+
 # Fixtures
 @pytest.fixture(scope="module")
-def auth_token():
-    """Get authentication token for tests"""
-    response = requests.post(f"{BASE_URL}/api/admin/login", json={
-        "email": ADMIN_EMAIL,
-        "password": ADMIN_PASSWORD
-    })
-    if response.status_code == 200:
-        return response.json().get("token")
-    pytest.skip("Authentication failed - skipping authenticated tests")
+def booking_date():
+    """Booking date five days ahead, computed once so every test sees the same day"""
+    return (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture(scope="module")
+def booking_template(booking_date):
+    """Default public booking payload; tests override the fields they care about"""
+    return {
+        "booking_date": booking_date,
+        "client_email": "test_booking@example.com",
+        "client_phone": "0000000000",
+        "session_type": "studio",
+        "package_id": "studio-mini",
+        "package_name": "Mini Session",
+        "package_price": 2500,
+        "booking_time": "09:00",
+        "notes": ""
+    }
+
+
+@pytest.fixture
+def fresh_booking(api_client, auth_token, booking_template):
+    """Create a throwaway booking via the public endpoint, yield its id, delete it afterwards"""
+    booking_data = {**booking_template, "client_name": f"TEST_{uuid.uuid4().hex[:6]}"}
+    response = _record(f"{BASE_URL}/api/admin/bookings", api_client.post(f"{BASE_URL}/api/bookings", json=booking_data))
+    assert response.status_code == 200
+    booking_id = loads(response.content)["id"]
+    yield booking_id
+    api_client.delete(f"{BASE_URL}/api/admin/bookings/{booking_id}",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
 
 
 @pytest.fixture(scope="module", autouse=True)
-def cleanup_test_data():
-    """Cleanup TEST_ prefixed data after all tests complete"""
+def cleanup_test_data(request, api_client):
+    """Delete every row this module created after all tests complete"""
+    # Reuse the session's admin login; without one there is nothing we can clean up
+    try:
+        headers = request.getfixturevalue("auth_headers")
+    except pytest.skip.Exception:
+        headers = None
     yield
-    # Cleanup after tests
+    if headers is None:
+        return
+    # Cleanup after tests: rows the tests already deleted answer 404
     try:
-        # Login to get token
-        login_response = requests.post(f"{BASE_URL}/api/admin/login", json={
-            "email": ADMIN_EMAIL,
-            "password": ADMIN_PASSWORD
-        })
-        if login_response.status_code == 200:
-            token = login_response.json().get("token")
-            headers = {"Authorization": f"Bearer {token}"}
-            
-            # Cleanup test packages
-            packages_response = requests.get(f"{BASE_URL}/api/admin/packages", headers=headers)
-            if packages_response.status_code == 200:
-                for pkg in packages_response.json():
-                    if pkg.get("name", "").startswith("TEST_"):
-                        requests.delete(f"{BASE_URL}/api/admin/packages/{pkg['id']}", headers=headers)
-            
-            # Cleanup test bookings
-            bookings_response = requests.get(f"{BASE_URL}/api/admin/bookings", headers=headers)
-            if bookings_response.status_code == 200:
-                for booking in bookings_response.json():
-                    if booking.get("client_name", "").startswith("TEST_"):
-                        requests.delete(f"{BASE_URL}/api/admin/bookings/{booking['id']}", headers=headers)
+        with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+            responses = list(executor.map(lambda url: api_client.delete(url, headers=headers), _created))
+        for response in responses:
+            if response.status_code not in (200, 404):
+                log.warning("Cleanup DELETE %s returned %s", response.url, response.status_code)
     except Exception as e:
-        print(f"Cleanup error: {e}")
+        log.warning("Cleanup error: %s", e)
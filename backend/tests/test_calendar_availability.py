@@ -6,10 +6,15 @@ Test module for the new calendar availability feature
 import pytest
 import requests
 import os
+from datetime import date, datetime
+from email.utils import parsedate_to_datetime
+
+from conftest import loads
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
 
+@pytest.mark.vcr
 class TestCalendarAvailabilityEndpoint:
     """Tests for /api/bookings/available-dates endpoint"""
 
@@ -17,14 +22,14 @@ class TestCalendarAvailabilityEndpoint:
         """Verify API is running"""
         response = requests.get(f"{BASE_URL}/api/health")
         assert response.status_code == 200
-        assert response.json()["status"] == "healthy"
+        assert loads(response.content)["status"] == "healthy"
         print("PASS: Health check OK")
 
     def test_available_dates_march_2026(self):
         """GET /api/bookings/available-dates?month=2026-03 returns dates with slot info"""
         response = requests.get(f"{BASE_URL}/api/bookings/available-dates?month=2026-03")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         
         # Verify response structure
         assert "month" in data
@@ -33,7 +38,7 @@ class TestCalendarAvailabilityEndpoint:
         
         # Verify dates structure if any dates are returned
         if data["dates"]:
-            sample_date = list(data["dates"].keys())[0]
+            sample_date = next(iter(data["dates"]))
             date_info = data["dates"][sample_date]
             assert "slots" in date_info
             assert "count" in date_info
@@ -48,7 +53,7 @@ class TestCalendarAvailabilityEndpoint:
         """GET /api/bookings/available-dates?month=2026-03&session_type=maternity returns filtered dates"""
         response = requests.get(f"{BASE_URL}/api/bookings/available-dates?month=2026-03&session_type=maternity")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         
         assert "month" in data
         assert "dates" in data
@@ -61,21 +66,22 @@ class TestCalendarAvailabilityEndpoint:
         """GET /api/bookings/available-dates?month=2026-02 returns only future dates with slots"""
         response = requests.get(f"{BASE_URL}/api/bookings/available-dates?month=2026-02")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         
         assert "month" in data
         assert "dates" in data
         assert data["month"] == "2026-02"
         
-        # All returned dates should be valid future dates
-        from datetime import datetime
-        today = datetime.now().strftime("%Y-%m-%d")
+        # All returned dates should be valid future dates, as of when the server answered;
+        # a replayed cassette carries its recording day in the Date header
+        served = response.headers.get("Date")
+        today = parsedate_to_datetime(served).date() if served else datetime.now().date()
         
-        for date_str in data["dates"].keys():
+        for date_str, date_info in data["dates"].items():
             # Dates should not be in the past
-            assert date_str >= today or date_str.startswith("2026"), f"Date {date_str} should be a future date"
+            assert date.fromisoformat(date_str) >= today, f"Date {date_str} should be a future date"
             # Each date should have slots
-            assert data["dates"][date_str]["count"] > 0
+            assert date_info["count"] > 0
         
         print(f"PASS: available-dates for February 2026 - {len(data['dates'])} future dates with slots")
 
@@ -83,13 +89,13 @@ class TestCalendarAvailabilityEndpoint:
         """Verify weekend dates have weekend_surcharge > 0"""
         response = requests.get(f"{BASE_URL}/api/bookings/available-dates?month=2026-03")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         
-        weekend_dates_found = False
-        for date_str, date_info in data["dates"].items():
-            if date_info["is_weekend"]:
-                weekend_dates_found = True
-                assert date_info["weekend_surcharge"] > 0, f"Weekend date {date_str} should have surcharge"
+        weekend_dates_found = any(info["is_weekend"] for info in data["dates"].values())
+        if weekend_dates_found:
+            for date_str, date_info in data["dates"].items():
+                if date_info["is_weekend"]:
+                    assert date_info["weekend_surcharge"] > 0, f"Weekend date {date_str} should have surcharge"
         
         if weekend_dates_found:
             print("PASS: Weekend dates have correct surcharge")
@@ -100,23 +106,33 @@ class TestCalendarAvailabilityEndpoint:
         """GET /api/bookings/available-dates with invalid month should return empty dates"""
         response = requests.get(f"{BASE_URL}/api/bookings/available-dates?month=invalid")
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "dates" in data
         assert len(data["dates"]) == 0
         print("PASS: Invalid month format handled gracefully")
 
 
+@pytest.mark.vcr
 class TestExistingEndpointsStillWork:
     """Verify other existing API endpoints still work after calendar feature addition"""
 
-    def test_packages_endpoint(self):
-        """GET /api/packages still works"""
-        response = requests.get(f"{BASE_URL}/api/packages")
+    @pytest.mark.parametrize("path, expected_type, expected_keys", [
+        pytest.param("/api/packages", list, set(), id="packages"),
+        pytest.param("/api/booking-settings", dict, {"weekend_surcharge"}, id="booking-settings"),
+        pytest.param("/api/bookings/available-times?date=2026-03-15", dict, {"date", "available_times"},
+                     id="legacy-available-times"),
+    ])
+    def test_existing_endpoint(self, path, expected_type, expected_keys):
+        """GET on existing public endpoints still works"""
+        response = requests.get(f"{BASE_URL}{path}")
         assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
-        print(f"PASS: /api/packages returns {len(data)} packages")
+        data = loads(response.content)
+        assert isinstance(data, expected_type), f"{path} returned {type(data).__name__}"
+        if expected_type is list:
+            assert len(data) > 0
+        else:
+            assert expected_keys <= data.keys()
+        print(f"PASS: {path} still works")
 
     def test_admin_login(self):
         """POST /api/admin/login still works"""
@@ -125,27 +141,10 @@ class TestExistingEndpointsStillWork:
             json={"email": "admin@silwerlining.com", "password": "Admin123!"}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "token" in data
         print("PASS: Admin login works")
 
-    def test_booking_settings(self):
-        """GET /api/booking-settings still works"""
-        response = requests.get(f"{BASE_URL}/api/booking-settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert "weekend_surcharge" in data
-        print("PASS: /api/booking-settings works")
-
-    def test_legacy_available_times_endpoint(self):
-        """GET /api/bookings/available-times (legacy) still works"""
-        response = requests.get(f"{BASE_URL}/api/bookings/available-times?date=2026-03-15")
-        assert response.status_code == 200
-        data = response.json()
-        assert "date" in data
-        assert "available_times" in data
-        print("PASS: Legacy /api/bookings/available-times endpoint still works")
-
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
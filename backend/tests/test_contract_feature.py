@@ -5,17 +5,40 @@ Test suite for Contract Feature
 - Contract in booking flow
 """
 import pytest
-import requests
 import os
+from datetime import datetime, timedelta
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
+# Booking dates are rolled forward from import time instead of hardcoded
+NOW = datetime.now()
+CONTRACT_BOOKING_DAYS_AHEAD = range(30, 37)
+
+# --mock serves the non-integration tests here from tests/fixtures
+pytestmark = pytest.mark.usefixtures("mock_backend")
+
+
+@pytest.fixture(scope="module")
+def available_times(api_client):
+    """Available-times lookup cached per (date, session_type); None if the endpoint errors"""
+    cache = {}
+    def lookup(date, session_type):
+        if (date, session_type) not in cache:
+            response = api_client.get(f"{BASE_URL}/api/bookings/available-times", params={
+                "date": date,
+                "session_type": session_type
+            })
+            cache[date, session_type] = response.json().get("available_times", []) if response.status_code == 200 else None
+        return cache[date, session_type]
+    return lookup
+
+
 class TestContractPublicAPI:
     """Test public contract endpoint"""
     
-    def test_get_public_contract(self):
+    def test_get_public_contract(self, api_client):
         """GET /api/contract - should return contract template"""
-        response = requests.get(f"{BASE_URL}/api/contract")
+        response = api_client.get(f"{BASE_URL}/api/contract")
         assert response.status_code == 200
         
         data = response.json()
@@ -38,24 +61,11 @@ class TestContractPublicAPI:
 class TestContractAdminAPI:
     """Test admin contract endpoints"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Get admin token"""
-        login_response = requests.post(
-            f"{BASE_URL}/api/admin/login",
-            json={"email": "admin@silwerlining.com", "password": "Admin123!"}
-        )
-        if login_response.status_code == 200:
-            self.token = login_response.json().get("token")
-            self.headers = {"Authorization": f"Bearer {self.token}"}
-        else:
-            pytest.skip("Admin login failed")
-    
-    def test_admin_get_contract(self):
+    def test_admin_get_contract(self, api_client, auth_headers):
         """GET /api/admin/contract - should return contract template with default content"""
-        response = requests.get(
+        response = api_client.get(
             f"{BASE_URL}/api/admin/contract",
-            headers=self.headers
+            headers=auth_headers
         )
         assert response.status_code == 200
         
@@ -77,12 +87,15 @@ class TestContractAdminAPI:
         
         print(f"✓ Admin contract API returns valid contract with correct field types")
     
-    def test_admin_update_contract(self):
+    # Safe alongside other workers: content and smart_fields are written back unchanged
+    # and no other test asserts on the contract title
+    @pytest.mark.integration
+    def test_admin_update_contract(self, api_client, auth_headers):
         """PUT /api/admin/contract - should update contract template"""
         # First get current contract
-        get_response = requests.get(
+        get_response = api_client.get(
             f"{BASE_URL}/api/admin/contract",
-            headers=self.headers
+            headers=auth_headers
         )
         original_contract = get_response.json()
         
@@ -93,17 +106,17 @@ class TestContractAdminAPI:
             "smart_fields": original_contract["smart_fields"]
         }
         
-        update_response = requests.put(
+        update_response = api_client.put(
             f"{BASE_URL}/api/admin/contract",
-            headers=self.headers,
+            headers=auth_headers,
             json=test_contract
         )
         assert update_response.status_code == 200
         
         # Verify update
-        verify_response = requests.get(
+        verify_response = api_client.get(
             f"{BASE_URL}/api/admin/contract",
-            headers=self.headers
+            headers=auth_headers
         )
         updated_data = verify_response.json()
         assert updated_data["title"] == "TEST Contract Title"
@@ -114,40 +127,37 @@ class TestContractAdminAPI:
             "content": original_contract["content"],
             "smart_fields": original_contract["smart_fields"]
         }
-        requests.put(
+        api_client.put(
             f"{BASE_URL}/api/admin/contract",
-            headers=self.headers,
+            headers=auth_headers,
             json=restore_contract
         )
         
         print("✓ Admin contract update works correctly")
     
-    def test_admin_contract_unauthorized(self):
+    def test_admin_contract_unauthorized(self, api_client):
         """GET /api/admin/contract without token should fail"""
-        response = requests.get(f"{BASE_URL}/api/admin/contract")
+        response = api_client.get(f"{BASE_URL}/api/admin/contract")
         assert response.status_code in [401, 403], "Should require authentication"
         print("✓ Admin contract endpoint requires authentication")
 
 
+@pytest.mark.integration
 class TestBookingWithContract:
     """Test booking flow with contract signing"""
     
-    def test_booking_with_contract_data(self):
+    def test_booking_with_contract_data(self, api_client, auth_headers, available_times):
         """POST /api/bookings - should accept contract data"""
-        # Get available times for a future date
-        date = "2026-02-24"
-        times_response = requests.get(
-            f"{BASE_URL}/api/bookings/available-times?date={date}&session_type=maternity"
-        )
-        
-        if times_response.status_code != 200:
-            pytest.skip("Could not get available times")
-        
-        times_data = times_response.json()
-        available_times = times_data.get("available_times", [])
-        
-        if not available_times:
-            pytest.skip("No available times for test date")
+        # Find the first date a month or so out that still has a free maternity slot
+        for days_ahead in CONTRACT_BOOKING_DAYS_AHEAD:
+            date = (NOW + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
+            times = available_times(date, "maternity")
+            if times is None:
+                pytest.skip("Could not get available times")
+            if times:
+                break
+        else:
+            pytest.skip("No available times in the test date window")
         
         # Create booking with contract data
         booking_payload = {
@@ -159,7 +169,7 @@ class TestBookingWithContract:
             "package_name": "Essential Collection",
             "package_price": 3200,
             "booking_date": date,
-            "booking_time": available_times[0],
+            "booking_time": times[0],
             "notes": "Test booking with contract",
             "selected_addons": [],
             "addons_total": 0,
@@ -182,7 +192,7 @@ class TestBookingWithContract:
             }
         }
         
-        response = requests.post(
+        response = api_client.post(
             f"{BASE_URL}/api/bookings",
             json=booking_payload
         )
@@ -197,40 +207,21 @@ class TestBookingWithContract:
         print(f"✓ Booking with contract data created successfully (ID: {data['id']})")
         
         # Cleanup - delete test booking
-        login_response = requests.post(
-            f"{BASE_URL}/api/admin/login",
-            json={"email": "admin@silwerlining.com", "password": "Admin123!"}
+        api_client.delete(
+            f"{BASE_URL}/api/admin/bookings/{data['id']}",
+            headers=auth_headers
         )
-        if login_response.status_code == 200:
-            token = login_response.json().get("token")
-            requests.delete(
-                f"{BASE_URL}/api/admin/bookings/{data['id']}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            print(f"✓ Test booking cleaned up")
+        print(f"✓ Test booking cleaned up")
 
 
 class TestContractSmartFields:
     """Test smart field types in contract"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Get admin token"""
-        login_response = requests.post(
-            f"{BASE_URL}/api/admin/login",
-            json={"email": "admin@silwerlining.com", "password": "Admin123!"}
-        )
-        if login_response.status_code == 200:
-            self.token = login_response.json().get("token")
-            self.headers = {"Authorization": f"Bearer {self.token}"}
-        else:
-            pytest.skip("Admin login failed")
-    
-    def test_smart_field_types(self):
+    def test_smart_field_types(self, api_client, auth_headers):
         """Verify all smart field types are present"""
-        response = requests.get(
+        response = api_client.get(
             f"{BASE_URL}/api/admin/contract",
-            headers=self.headers
+            headers=auth_headers
         )
         assert response.status_code == 200
         
@@ -4,21 +4,122 @@ Test Payment and Booking Flow - Tests for bug fix:
 2. PayFast payment initiation returns form_data with full domain URLs
 3. EFT payment initiation returns bank details and reference
 """
+import importlib.util
+import logging
 import pytest
 import requests
 import os
+import types
+
+from conftest import loads, schema_validator
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+ADMIN_EMAIL = "admin@silwerlining.com"
+ADMIN_PASSWORD = "Admin123!"
+
+# Without a backend URL every request here is relative and fails with MissingSchema
+pytestmark = pytest.mark.skipif(not BASE_URL, reason="REACT_APP_BACKEND_URL unset")
+
+# Endpoint URLs, built once
+EP = types.SimpleNamespace(
+    bookings=f"{BASE_URL}/api/bookings",
+    available_dates=f"{BASE_URL}/api/bookings/available-dates",
+    available_times=f"{BASE_URL}/api/bookings/available-times",
+    payments_initiate=f"{BASE_URL}/api/payments/initiate",
+    payments_status=f"{BASE_URL}/api/payments/status",
+    health=f"{BASE_URL}/api/health",
+    packages=f"{BASE_URL}/api/packages",
+    booking_settings=f"{BASE_URL}/api/booking-settings",
+    payment_settings=f"{BASE_URL}/api/payment-settings",
+    addons=f"{BASE_URL}/api/addons",
+    admin_login=f"{BASE_URL}/api/admin/login",
+    admin_bookings=f"{BASE_URL}/api/admin/bookings",
+)
+
+# PayFast initiation response, compiled once; a mismatch raises JsonSchemaValueException naming the path
+validate_payfast_initiation = schema_validator({
+    "type": "object",
+    "required": ["payment_method", "payment_url", "form_data", "amount"],
+    "properties": {
+        "payment_method": {"const": "payfast"},
+        "form_data": {
+            "type": "object",
+            "required": ["return_url", "cancel_url", "notify_url", "merchant_id", "merchant_key", "signature", "amount"],
+            "properties": {
+                "return_url": {"type": "string", "pattern": "^https://[^/]+.*/payment/return"},
+                "cancel_url": {"type": "string", "pattern": "^https://[^/]+.*/payment/cancel"},
+                "notify_url": {"type": "string", "pattern": "^https://[^/]+.*/api/payments/payfast-itn"},
+            }
+        }
+    }
+})
+
+# Origin header the frontend sends with PayFast initiation requests
+PAYFAST_ORIGIN_HEADERS = {"Origin": "https://photo-biz-hub-3.preview.emergentagent.com"}
+
+log = logging.getLogger(__name__)
+
+# Fields every booking payload here shares; tests spread it and set the rest. Empty notes,
+# add-ons, contract and payment fields are left to the BookingCreate defaults, not sent
+BASE_BOOKING_PAYLOAD = {
+    "client_phone": "+27123456789",
+}
+
+# Booking the payment tests initiate payments against
+PAYMENT_FLOW_BOOKING = {
+    **BASE_BOOKING_PAYLOAD,
+    "client_name": "TEST_Payment_Flow",
+    "client_email": "payment_test@example.com",
+    "client_phone": "+27821234567",
+    "session_type": "maternity",
+    "package_id": "mat-signature",
+    "package_name": "Signature",
+    "package_price": 5500,
+    "booking_date": "2026-03-25",
+    "booking_time": "14:00",
+    "selected_addons": ["makeup"],
+    "addons_total": 800,
+    "total_price": 6300,
+    "contract_signed": True,
+    "contract_data": {"signature_data": "test"}
+}
+
+
+# {purpose: booking id} for the bookings prebuilt_bookings created; cleanup_test_data deletes these
+_prebuilt = {}
+
+
+@pytest.fixture(scope="module")
+def prebuilt_bookings(api_client):
+    """Create the payment-flow booking once for the module; returns {purpose: booking id}"""
+    response = api_client.post(EP.bookings, json=PAYMENT_FLOW_BOOKING)
+    assert response.status_code in [200, 201], f"Failed to create payment_flow booking: {response.text}"
+    _prebuilt["payment_flow"] = loads(response.content)["id"]
+    return _prebuilt
+
+
+@pytest.fixture(scope="module")
+def booking_with_payment(api_client, prebuilt_bookings):
+    """The payment-flow booking with a PayFast deposit initiated once for the module"""
+    booking_id = prebuilt_bookings["payment_flow"]
+    payment_payload = {
+        "booking_id": booking_id,
+        "payment_method": "payfast",
+        "payment_type": "deposit"
+    }
+    response = api_client.post(EP.payments_initiate, json=payment_payload, headers=PAYFAST_ORIGIN_HEADERS)
+    assert response.status_code == 200, f"Failed to initiate payment: {response.text}"
+    return booking_id
+
 
 class TestBookingCreationWithAddons:
     """Test booking creation with selected_addons as list of strings"""
     
-    def test_create_booking_with_addon_ids(self):
-        """Test that booking can be created with selected_addons as list of string IDs (bug fix)"""
-        payload = {
+    @pytest.mark.parametrize("overrides,expected", [
+        # Bug fix: selected_addons as a list of string IDs must not 422
+        pytest.param({
             "client_name": "TEST_Payment_User",
             "client_email": "test_payment@example.com",
-            "client_phone": "+27123456789",
             "session_type": "maternity",
             "package_id": "mat-essential",
             "package_name": "Essential",
@@ -29,68 +130,25 @@ class TestBookingCreationWithAddons:
             "selected_addons": ["makeup", "extra_images"],  # List of strings, NOT list of dicts
             "addons_total": 2300,
             "total_price": 5800,
-            "is_weekend": False,
-            "weekend_surcharge": 0,
-            "contract_signed": False,
-            "contract_data": {},
-            "questionnaire_responses": {},
             "payment_method": "payfast",
             "payment_type": "deposit"
-        }
-        
-        response = requests.post(f"{BASE_URL}/api/bookings", json=payload)
-        print(f"Create booking response: {response.status_code}")
-        
-        # Should NOT return 422 (validation error) with new model fix
-        assert response.status_code in [200, 201], f"Expected 200/201, got {response.status_code}: {response.text}"
-        
-        data = response.json()
-        assert "id" in data, "Booking should have an id"
-        assert data["client_name"] == "TEST_Payment_User"
-        assert data["selected_addons"] == ["makeup", "extra_images"], "selected_addons should be list of strings"
-        
-        # Save booking_id for payment tests
-        return data["id"]
-    
-    def test_create_booking_with_empty_addons(self):
-        """Test booking can be created with empty addons list"""
-        payload = {
+        }, {"client_name": "TEST_Payment_User",
+            "selected_addons": ["makeup", "extra_images"]}, id="addon_ids"),
+        pytest.param({
             "client_name": "TEST_No_Addons_User",
             "client_email": "test_no_addons@example.com",
-            "client_phone": "+27123456789",
             "session_type": "newborn",
             "package_id": "new-precious",
             "package_name": "Precious Moments",
             "package_price": 4500,
             "booking_date": "2026-03-20",
             "booking_time": "10:00",
-            "notes": "",
             "selected_addons": [],
-            "addons_total": 0,
-            "total_price": 4500,
-            "is_weekend": False,
-            "weekend_surcharge": 0,
-            "contract_signed": False,
-            "contract_data": {},
-            "questionnaire_responses": {},
-            "payment_method": "",
-            "payment_type": ""
-        }
-        
-        response = requests.post(f"{BASE_URL}/api/bookings", json=payload)
-        print(f"Create booking with empty addons: {response.status_code}")
-        
-        assert response.status_code in [200, 201]
-        data = response.json()
-        assert data["selected_addons"] == []
-        return data["id"]
-    
-    def test_create_booking_with_weekend_surcharge(self):
-        """Test booking with weekend flag and surcharge"""
-        payload = {
+            "total_price": 4500
+        }, {"selected_addons": []}, id="empty_addons"),
+        pytest.param({
             "client_name": "TEST_Weekend_User",
             "client_email": "test_weekend@example.com",
-            "client_phone": "+27123456789",
             "session_type": "studio",
             "package_id": "studio-classic",
             "package_name": "Classic",
@@ -103,57 +161,35 @@ class TestBookingCreationWithAddons:
             "total_price": 5300,  # 4000 + 800 + 500 surcharge
             "is_weekend": True,
             "weekend_surcharge": 500,
-            "contract_signed": False,
-            "contract_data": {},
-            "questionnaire_responses": {},
             "payment_method": "eft",
             "payment_type": "full"
-        }
+        }, {"is_weekend": True, "weekend_surcharge": 500}, id="weekend"),
+    ])
+    def test_create_booking(self, api_client, overrides, expected):
+        """Booking creation accepts each payload shape and echoes it back"""
+        payload = {**BASE_BOOKING_PAYLOAD, **overrides}
+        
+        response = api_client.post(EP.bookings, json=payload)
+        log.debug("Create booking response: %s", response.status_code)
         
-        response = requests.post(f"{BASE_URL}/api/bookings", json=payload)
-        print(f"Create weekend booking: {response.status_code}")
+        # Should NOT return 422 (validation error) with new model fix
+        assert response.status_code in [200, 201], f"Expected 200/201, got {response.status_code}: {response.text}"
         
-        assert response.status_code in [200, 201]
-        data = response.json()
-        assert data["is_weekend"] == True
-        assert data["weekend_surcharge"] == 500
-        return data["id"]
+        data = loads(response.content)
+        assert "id" in data, "Booking should have an id"
+        for key, value in expected.items():
+            assert data[key] == value, f"{key}: expected {value!r}, got {data[key]!r}"
 
 
 class TestPaymentInitiation:
     """Test payment initiation endpoints for PayFast and EFT"""
     
-    @pytest.fixture
-    def booking_id(self):
-        """Create a booking for payment tests"""
-        payload = {
-            "client_name": "TEST_Payment_Flow",
-            "client_email": "payment_test@example.com",
-            "client_phone": "+27821234567",
-            "session_type": "maternity",
-            "package_id": "mat-signature",
-            "package_name": "Signature",
-            "package_price": 5500,
-            "booking_date": "2026-03-25",
-            "booking_time": "14:00",
-            "notes": "",
-            "selected_addons": ["makeup"],
-            "addons_total": 800,
-            "total_price": 6300,
-            "is_weekend": False,
-            "weekend_surcharge": 0,
-            "contract_signed": True,
-            "contract_data": {"signature_data": "test"},
-            "questionnaire_responses": {},
-            "payment_method": "",
-            "payment_type": ""
-        }
-        
-        response = requests.post(f"{BASE_URL}/api/bookings", json=payload)
-        assert response.status_code in [200, 201], f"Failed to create booking: {response.text}"
-        return response.json()["id"]
+    @pytest.fixture(scope="class")
+    def booking_id(self, prebuilt_bookings):
+        """One booking shared by the class's payment tests (none of them change it)"""
+        return prebuilt_bookings["payment_flow"]
     
-    def test_payfast_payment_initiation(self, booking_id):
+    def test_payfast_payment_initiation(self, api_client, booking_id):
         """Test PayFast payment initiation returns form_data with FULL domain URLs"""
         payload = {
             "booking_id": booking_id,
@@ -161,56 +197,26 @@ class TestPaymentInitiation:
             "payment_type": "deposit"
         }
         
-        # Include origin header to simulate frontend request
-        headers = {
-            "Content-Type": "application/json",
-            "Origin": "https://photo-biz-hub-3.preview.emergentagent.com"
-        }
-        
-        response = requests.post(f"{BASE_URL}/api/payments/initiate", json=payload, headers=headers)
-        print(f"PayFast initiation response: {response.status_code}")
+        response = api_client.post(EP.payments_initiate, json=payload, headers=PAYFAST_ORIGIN_HEADERS)
+        log.debug("PayFast initiation response: %s", response.status_code)
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
         
-        data = response.json()
-        print(f"PayFast response data: {data}")
-        
-        # Validate PayFast response structure
-        assert data["payment_method"] == "payfast"
-        assert "payment_url" in data
-        assert "form_data" in data
-        assert "amount" in data
+        data = loads(response.content)
+        log.debug("PayFast response data: %s", data)
         
+        # Structure, and the full-domain https URLs from the bug fix, in one validation pass
+        validate_payfast_initiation(data)
         form_data = data["form_data"]
-        
-        # CRITICAL: Verify URLs contain full domain (bug fix validation)
-        assert "return_url" in form_data
-        assert "cancel_url" in form_data
-        assert "notify_url" in form_data
-        
-        # URLs should start with https:// and contain full domain
-        assert form_data["return_url"].startswith("https://"), f"return_url should have full domain: {form_data['return_url']}"
-        assert form_data["cancel_url"].startswith("https://"), f"cancel_url should have full domain: {form_data['cancel_url']}"
-        assert form_data["notify_url"].startswith("https://"), f"notify_url should have full domain: {form_data['notify_url']}"
-        
-        # Verify the URLs contain the expected structure
-        assert "/payment/return" in form_data["return_url"], f"return_url missing path: {form_data['return_url']}"
-        assert "/payment/cancel" in form_data["cancel_url"], f"cancel_url missing path: {form_data['cancel_url']}"
-        assert "/api/payments/payfast-itn" in form_data["notify_url"], f"notify_url missing path: {form_data['notify_url']}"
+        return_url, cancel_url = form_data["return_url"], form_data["cancel_url"]
         
         # Verify booking_id is in URLs
-        assert booking_id in form_data["return_url"]
-        assert booking_id in form_data["cancel_url"]
-        
-        # Verify other form fields
-        assert "merchant_id" in form_data
-        assert "merchant_key" in form_data
-        assert "signature" in form_data
-        assert "amount" in form_data
+        assert booking_id in return_url
+        assert booking_id in cancel_url
         
-        print(f"PayFast URLs validated - return_url: {form_data['return_url']}")
+        log.debug("PayFast URLs validated - return_url: %s", return_url)
     
-    def test_payfast_payment_full_amount(self, booking_id):
+    def test_payfast_payment_full_amount(self, api_client, booking_id):
         """Test PayFast with full payment amount"""
         payload = {
             "booking_id": booking_id,
@@ -218,19 +224,14 @@ class TestPaymentInitiation:
             "payment_type": "full"
         }
         
-        headers = {
-            "Content-Type": "application/json",
-            "Origin": "https://photo-biz-hub-3.preview.emergentagent.com"
-        }
-        
-        response = requests.post(f"{BASE_URL}/api/payments/initiate", json=payload, headers=headers)
+        response = api_client.post(EP.payments_initiate, json=payload, headers=PAYFAST_ORIGIN_HEADERS)
         assert response.status_code == 200
         
-        data = response.json()
+        data = loads(response.content)
         # Full payment should be the total_price (6300)
         assert data["amount"] == 6300, f"Full amount should be 6300, got {data['amount']}"
     
-    def test_eft_payment_initiation(self, booking_id):
+    def test_eft_payment_initiation(self, api_client, booking_id):
         """Test EFT payment initiation returns bank details and reference"""
         payload = {
             "booking_id": booking_id,
@@ -238,13 +239,13 @@ class TestPaymentInitiation:
             "payment_type": "deposit"
         }
         
-        response = requests.post(f"{BASE_URL}/api/payments/initiate", json=payload)
-        print(f"EFT initiation response: {response.status_code}")
+        response = api_client.post(EP.payments_initiate, json=payload)
+        log.debug("EFT initiation response: %s", response.status_code)
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
         
-        data = response.json()
-        print(f"EFT response data: {data}")
+        data = loads(response.content)
+        log.debug("EFT response data: %s", data)
         
         # Validate EFT response structure
         assert data["payment_method"] == "eft"
@@ -260,13 +261,14 @@ class TestPaymentInitiation:
         assert "branch_code" in bank_details
         assert "account_type" in bank_details
         assert "reference" in bank_details
+        reference = bank_details["reference"]
         
         # Verify reference contains booking_id
-        assert booking_id[:8].upper() in bank_details["reference"], f"Reference should contain booking ID: {bank_details['reference']}"
+        assert booking_id[:8].upper() in reference, f"Reference should contain booking ID: {reference}"
         
-        print(f"EFT bank details validated - reference: {bank_details['reference']}")
+        log.debug("EFT bank details validated - reference: %s", reference)
     
-    def test_payflex_payment_mocked(self, booking_id):
+    def test_payflex_payment_mocked(self, api_client, booking_id):
         """Test PayFlex payment returns mocked/placeholder response"""
         payload = {
             "booking_id": booking_id,
@@ -274,192 +276,128 @@ class TestPaymentInitiation:
             "payment_type": "deposit"
         }
         
-        response = requests.post(f"{BASE_URL}/api/payments/initiate", json=payload)
-        print(f"PayFlex response: {response.status_code}")
+        response = api_client.post(EP.payments_initiate, json=payload)
+        log.debug("PayFlex response: %s", response.status_code)
         
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         
         assert data["payment_method"] == "payflex"
         # PayFlex is MOCKED - should return placeholder message
         assert "message" in data
         assert "coming soon" in data["message"].lower() or "placeholder" in data["message"].lower()
         
-        print(f"PayFlex MOCKED response: {data['message']}")
+        log.debug("PayFlex MOCKED response: %s", data['message'])
     
-    def test_invalid_payment_method(self, booking_id):
-        """Test invalid payment method returns error"""
-        payload = {
-            "booking_id": booking_id,
-            "payment_method": "invalid_method",
-            "payment_type": "deposit"
-        }
-        
-        response = requests.post(f"{BASE_URL}/api/payments/initiate", json=payload)
-        print(f"Invalid payment method response: {response.status_code}")
-        
-        assert response.status_code == 400
-    
-    def test_nonexistent_booking_payment(self):
-        """Test payment initiation with non-existent booking"""
-        payload = {
-            "booking_id": "nonexistent-booking-id",
-            "payment_method": "payfast",
-            "payment_type": "deposit"
-        }
-        
-        response = requests.post(f"{BASE_URL}/api/payments/initiate", json=payload)
-        print(f"Nonexistent booking response: {response.status_code}")
-        
-        assert response.status_code == 404
+    # A booking_id of None is replaced with the class's real booking
+    @pytest.mark.parametrize("method,url,body,expected", [
+        pytest.param("POST", EP.payments_initiate,
+                     {"booking_id": None, "payment_method": "invalid_method", "payment_type": "deposit"},
+                     400, id="invalid_payment_method"),
+        pytest.param("POST", EP.payments_initiate,
+                     {"booking_id": "nonexistent-booking-id", "payment_method": "payfast", "payment_type": "deposit"},
+                     404, id="initiate_nonexistent_booking"),
+        pytest.param("GET", f"{EP.payments_status}/nonexistent-id", None, 404, id="status_nonexistent_booking"),
+    ])
+    def test_negative_path(self, api_client, request, method, url, body, expected):
+        """Bad payment method or unknown booking is rejected"""
+        if body is not None and body["booking_id"] is None:
+            body = {**body, "booking_id": request.getfixturevalue("booking_id")}
+        
+        response = api_client.request(method, url, json=body)
+        log.debug("%s %s response: %s", method, url, response.status_code)
+        
+        assert response.status_code == expected
 
 
 class TestPaymentStatus:
     """Test payment status endpoints"""
     
-    @pytest.fixture
-    def booking_with_payment(self):
-        """Create booking and initiate payment"""
-        # Create booking
-        payload = {
-            "client_name": "TEST_Status_Check",
-            "client_email": "status_test@example.com",
-            "client_phone": "+27821234567",
-            "session_type": "maternity",
-            "package_id": "mat-essential",
-            "package_name": "Essential",
-            "package_price": 3500,
-            "booking_date": "2026-03-28",
-            "booking_time": "11:00",
-            "notes": "",
-            "selected_addons": [],
-            "addons_total": 0,
-            "total_price": 3500,
-            "is_weekend": False,
-            "weekend_surcharge": 0,
-            "contract_signed": False,
-            "contract_data": {},
-            "questionnaire_responses": {},
-            "payment_method": "",
-            "payment_type": ""
-        }
-        
-        response = requests.post(f"{BASE_URL}/api/bookings", json=payload)
-        assert response.status_code in [200, 201]
-        booking_id = response.json()["id"]
-        
-        # Initiate payment
-        payment_payload = {
-            "booking_id": booking_id,
-            "payment_method": "payfast",
-            "payment_type": "deposit"
-        }
-        headers = {"Origin": "https://photo-biz-hub-3.preview.emergentagent.com"}
-        requests.post(f"{BASE_URL}/api/payments/initiate", json=payment_payload, headers=headers)
-        
-        return booking_id
-    
-    def test_get_payment_status(self, booking_with_payment):
+    def test_get_payment_status(self, api_client, booking_with_payment):
         """Test getting payment status for a booking"""
         booking_id = booking_with_payment
         
-        response = requests.get(f"{BASE_URL}/api/payments/status/{booking_id}")
-        print(f"Payment status response: {response.status_code}")
+        response = api_client.get(f"{EP.payments_status}/{booking_id}")
+        log.debug("Payment status response: %s", response.status_code)
         
         assert response.status_code == 200
         
-        data = response.json()
+        data = loads(response.content)
         assert data["booking_id"] == booking_id
         assert "status" in data
         assert "payment_status" in data
         assert "payment_method" in data
         assert "total_price" in data
         
-        print(f"Payment status: {data}")
-    
-    def test_get_payment_status_nonexistent(self):
-        """Test payment status for non-existent booking"""
-        response = requests.get(f"{BASE_URL}/api/payments/status/nonexistent-id")
-        assert response.status_code == 404
+        log.debug("Payment status: %s", data)
+
 
+@pytest.fixture(scope="module")
+def backend_available(api_client):
+    """One short health probe; a dead backend skips the smoke checks instead of timing each out"""
+    try:
+        response = api_client.get(EP.health, timeout=2)
+    except requests.RequestException as e:
+        pytest.skip(f"backend unavailable: {e}")
+    if response.status_code != 200:
+        pytest.skip(f"backend unavailable: /api/health returned {response.status_code}")
 
+
+@pytest.mark.usefixtures("backend_available")
 class TestExistingEndpointsNoRegression:
     """Verify existing endpoints still work after model changes"""
     
-    def test_health_endpoint(self):
-        """Test health endpoint"""
-        response = requests.get(f"{BASE_URL}/api/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-    
-    def test_packages_endpoint(self):
-        """Test packages endpoint"""
-        response = requests.get(f"{BASE_URL}/api/packages")
-        assert response.status_code == 200
-        packages = response.json()
-        assert len(packages) > 0
-    
-    def test_packages_filtered_by_session_type(self):
-        """Test packages filtered by session type"""
-        response = requests.get(f"{BASE_URL}/api/packages?session_type=maternity")
-        assert response.status_code == 200
-        packages = response.json()
-        for pkg in packages:
-            assert pkg["session_type"] == "maternity"
-    
-    def test_booking_settings_endpoint(self):
-        """Test booking settings endpoint"""
-        response = requests.get(f"{BASE_URL}/api/booking-settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert "time_slots" in data or "time_slot_schedule" in data
-    
-    def test_payment_settings_endpoint(self):
-        """Test public payment settings endpoint"""
-        response = requests.get(f"{BASE_URL}/api/payment-settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert "payfast_enabled" in data
-    
-    def test_addons_endpoint(self):
-        """Test add-ons endpoint"""
-        response = requests.get(f"{BASE_URL}/api/addons")
-        assert response.status_code == 200
-    
-    def test_available_dates_endpoint(self):
-        """Test available dates endpoint still works"""
-        response = requests.get(f"{BASE_URL}/api/bookings/available-dates?month=2026-03")
-        assert response.status_code == 200
-        data = response.json()
-        assert "dates" in data
-    
-    def test_available_times_endpoint(self):
-        """Test available times endpoint still works"""
-        response = requests.get(f"{BASE_URL}/api/bookings/available-times?date=2026-03-15")
+    @pytest.mark.parametrize("url,check", [
+        pytest.param(EP.health, lambda data: data["status"] == "healthy", id="health"),
+        pytest.param(EP.packages, lambda packages: len(packages) > 0, id="packages"),
+        pytest.param(f"{EP.packages}?session_type=maternity",
+                     lambda packages: all(pkg["session_type"] == "maternity" for pkg in packages),
+                     id="packages_by_session_type"),
+        pytest.param(EP.booking_settings,
+                     lambda data: "time_slots" in data or "time_slot_schedule" in data, id="booking_settings"),
+        pytest.param(EP.payment_settings, lambda data: "payfast_enabled" in data, id="payment_settings"),
+        pytest.param(EP.addons, None, id="addons"),
+        pytest.param(f"{EP.available_dates}?month=2026-03", lambda data: "dates" in data, id="available_dates"),
+        pytest.param(f"{EP.available_times}?date=2026-03-15",
+                     lambda data: "available_times" in data, id="available_times"),
+    ])
+    def test_endpoint(self, api_client, url, check):
+        """Existing public GET endpoint still answers with the expected shape"""
+        response = api_client.get(url)
         assert response.status_code == 200
-        data = response.json()
-        assert "available_times" in data
+        if check is not None:
+            assert check(loads(response.content)), f"Unexpected body from {url}: {response.text[:200]}"
     
-    def test_admin_login(self):
+    def test_admin_login(self, api_client):
         """Test admin login endpoint still works"""
-        response = requests.post(f"{BASE_URL}/api/admin/login", json={
-            "email": "admin@silwerlining.com",
-            "password": "Admin123!"
+        response = api_client.post(EP.admin_login, json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
         })
         assert response.status_code == 200
-        data = response.json()
-        assert "token" in data
+        assert "token" in loads(response.content)
 
 
 # Cleanup fixture for all test classes
-@pytest.fixture(scope="session", autouse=True)
-def cleanup_test_data():
-    """Cleanup test data after all tests complete"""
+@pytest.fixture(scope="module", autouse=True)
+def cleanup_test_data(request):
+    """Delete the bookings prebuilt_bookings created once the module's tests complete"""
     yield
-    # Note: In production, you would delete TEST_ prefixed bookings here
-    print("Test cleanup complete")
+    if not _prebuilt:
+        return
+    # Only the ids created here; other workers may still be using their own TEST_ bookings
+    client = request.getfixturevalue("authenticated_client")
+    for purpose, booking_id in list(_prebuilt.items()):
+        response = client.delete(f"{EP.admin_bookings}/{booking_id}")
+        if response.status_code in (200, 404):
+            del _prebuilt[purpose]
+        else:
+            log.warning("Cleanup DELETE %s returned %s", response.url, response.status_code)
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
+    args = [__file__, "-v", "--tb=short"]
+    # pytest-xdist is optional; every test here is an independent HTTP round trip
+    if importlib.util.find_spec("xdist"):
+        args += ["-n", "auto", "--dist=loadgroup"]
+    pytest.main(args)
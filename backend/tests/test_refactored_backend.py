@@ -3,166 +3,141 @@ Backend Regression Tests for Refactored API
 Tests all public and admin endpoints after monolithic server.py was split into modular FastAPI routers
 """
 import pytest
-import requests
 import os
+import types
 
-BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://photo-biz-hub-3.preview.emergentagent.com')
+from conftest import loads
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://photo-biz-hub-3.preview.emergentagent.com').rstrip('/')
 
 # Admin credentials
 ADMIN_EMAIL = "admin@silwerlining.com"
 ADMIN_PASSWORD = "Admin123!"
 
-
-@pytest.fixture(scope="module")
-def api_client():
-    """Shared requests session"""
-    session = requests.Session()
-    session.headers.update({"Content-Type": "application/json"})
-    return session
-
-
-@pytest.fixture(scope="module")
-def auth_token(api_client):
-    """Get authentication token for admin endpoints"""
-    response = api_client.post(f"{BASE_URL}/api/admin/login", json={
-        "email": ADMIN_EMAIL,
-        "password": ADMIN_PASSWORD
-    })
-    if response.status_code == 200:
-        return response.json().get("token")
-    pytest.skip("Authentication failed - skipping authenticated tests")
-
-
-@pytest.fixture(scope="module")
-def authenticated_client(api_client, auth_token):
-    """Session with auth header"""
-    api_client.headers.update({"Authorization": f"Bearer {auth_token}"})
-    return api_client
+EP = types.SimpleNamespace(
+    admin_login=f"{BASE_URL}/api/admin/login",
+    process_reminders=f"{BASE_URL}/api/cron/process-reminders",
+)
+
+# Server-side latency budgets (response.elapsed, ms); anything unlisted gets the default.
+# Opt-in with LATENCY_BUDGETS=1, since the remote preview host is too jittery to enforce them on every run
+ENFORCE_LATENCY_BUDGETS = os.environ.get("LATENCY_BUDGETS") == "1"
+DEFAULT_LATENCY_BUDGET_MS = 2000
+LATENCY_BUDGETS_MS = {
+    "/api/health": 500,
+    "/api/packages": 1000,
+    "/api/faqs": 1000,
+    "/api/booking-settings": 1000,
+}
+
+
+def timed_get(client, path, budget_ms=None):
+    """GET a path; with LATENCY_BUDGETS=1, fail the test if the server took longer than its latency budget"""
+    if budget_ms is None:
+        budget_ms = LATENCY_BUDGETS_MS.get(path, DEFAULT_LATENCY_BUDGET_MS)
+    response = client.get(GET_URLS[path])
+    elapsed_ms = response.elapsed.total_seconds() * 1000
+    if ENFORCE_LATENCY_BUDGETS and elapsed_ms > budget_ms:
+        pytest.fail(f"{path} took {elapsed_ms:.0f}ms (>{budget_ms}ms)")
+    return response
+
+
+# ==================== RESPONSE VALIDATORS ====================
+
+def _has_keys(*keys):
+    """Validator for a JSON object; a tuple key passes if any one of its alternatives is present"""
+    def check(data):
+        assert isinstance(data, dict), f"expected an object, got {type(data).__name__}"
+        for key in keys:
+            options = key if isinstance(key, tuple) else (key,)
+            assert any(option in data for option in options), f"missing {' or '.join(options)}"
+    return check
+
+
+def _list_of(*keys, non_empty=False):
+    """Validator for a JSON list whose first few items carry the given keys"""
+    def check(data):
+        assert isinstance(data, list), f"expected a list, got {type(data).__name__}"
+        if non_empty:
+            assert data, "expected at least one item"
+        for item in data[:3]:
+            for key in keys:
+                assert key in item, f"item is missing {key}"
+    return check
+
+
+def _check_health(data):
+    assert data.get("status") == "healthy"
+
+
+# (path, validator) for every independent read-only GET
+PUBLIC_GET_CASES = [
+    ("/api/health", _check_health),
+    ("/api/packages", _list_of("id", "name", "session_type", "price", non_empty=True)),
+    ("/api/testimonials", _list_of("client_name", "content")),
+    ("/api/portfolio", _list_of("id", "title", "category", "image_url", non_empty=True)),
+    ("/api/faqs", _list_of("question", "answer")),
+    ("/api/addons", _list_of("id", "name", "price")),
+    ("/api/booking-settings", _has_keys("id", ("time_slot_schedule", "time_slots"))),
+    ("/api/contract", _has_keys("id", ("title", "content"))),
+    ("/api/payments/settings", _has_keys("payfast_enabled")),
+    # May have posts or error if not configured
+    ("/api/instagram/feed", _has_keys(("posts", "error"))),
+    ("/api/google-reviews/public", _has_keys("reviews")),
+]
+
+ADMIN_GET_CASES = [
+    ("/api/admin/stats", _has_keys("total_bookings", "pending_bookings", "confirmed_bookings", "portfolio_count")),
+    ("/api/admin/bookings", _list_of()),
+    ("/api/admin/packages", _list_of(non_empty=True)),
+    ("/api/admin/portfolio", _list_of()),
+    ("/api/admin/testimonials", _list_of()),
+    ("/api/admin/email-settings", _has_keys()),
+    ("/api/admin/payment-settings", _has_keys()),
+    ("/api/admin/contract", _has_keys("id")),
+    ("/api/admin/booking-settings", _has_keys("id")),
+    ("/api/admin/faqs", _list_of()),
+    ("/api/admin/questionnaires", _list_of()),
+    ("/api/admin/email-templates", _list_of()),
+    ("/api/admin/storage-settings", _has_keys()),
+    ("/api/admin/instagram-settings", _has_keys()),
+    ("/api/admin/automated-reminders", _list_of()),
+]
+
+# Full URLs built once, so parallel workers hand requests the same string objects
+GET_URLS = {path: f"{BASE_URL}{path}" for path, _ in PUBLIC_GET_CASES + ADMIN_GET_CASES}
+
+
+def _check_get(client, path, validator):
+    response = timed_get(client, path)
+    assert response.status_code == 200, f"GET {path} returned {response.status_code}"
+    validator(loads(response.content))
+
+
+def _check_all(client, cases, thread_pool):
+    # list() re-raises the first failed check here, in the test's own thread
+    list(thread_pool.map(lambda case: _check_get(client, *case), cases))
+
+
+# The fast lane issues each group's GETs concurrently; the per-endpoint tests below are slow-only.
+# Public and admin stay separate so a failed admin login doesn't skip the public checks
+def test_public_read_only_endpoints(api_client, thread_pool):
+    """Public read-only GETs issued concurrently over the pooled session"""
+    _check_all(api_client, PUBLIC_GET_CASES, thread_pool)
+
+
+def test_admin_read_only_endpoints(authenticated_client, thread_pool):
+    """Admin read-only GETs issued concurrently over the admin session"""
+    _check_all(authenticated_client, ADMIN_GET_CASES, thread_pool)
 
 
 # ==================== PUBLIC ENDPOINTS ====================
 
-class TestPublicEndpoints:
-    """Tests for public (unauthenticated) endpoints"""
-    
-    def test_health_check(self, api_client):
-        """Test GET /api/health"""
-        response = api_client.get(f"{BASE_URL}/api/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert "status" in data
-        assert data["status"] == "healthy"
-        print("✓ Health check endpoint working")
-    
-    def test_packages_endpoint(self, api_client):
-        """Test GET /api/packages"""
-        response = api_client.get(f"{BASE_URL}/api/packages")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
-        # Verify package structure
-        for pkg in data[:3]:
-            assert "id" in pkg
-            assert "name" in pkg
-            assert "session_type" in pkg
-            assert "price" in pkg
-        print(f"✓ Packages endpoint returned {len(data)} packages")
-    
-    def test_testimonials_endpoint(self, api_client):
-        """Test GET /api/testimonials"""
-        response = api_client.get(f"{BASE_URL}/api/testimonials")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Verify testimonial structure
-        for t in data[:2]:
-            assert "client_name" in t
-            assert "content" in t
-        print(f"✓ Testimonials endpoint returned {len(data)} testimonials")
-    
-    def test_portfolio_endpoint(self, api_client):
-        """Test GET /api/portfolio"""
-        response = api_client.get(f"{BASE_URL}/api/portfolio")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
-        # Verify portfolio structure
-        for item in data[:2]:
-            assert "id" in item
-            assert "title" in item
-            assert "category" in item
-            assert "image_url" in item
-        print(f"✓ Portfolio endpoint returned {len(data)} items")
-    
-    def test_faqs_endpoint(self, api_client):
-        """Test GET /api/faqs"""
-        response = api_client.get(f"{BASE_URL}/api/faqs")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Verify FAQ structure
-        for faq in data[:2]:
-            assert "question" in faq
-            assert "answer" in faq
-        print(f"✓ FAQs endpoint returned {len(data)} FAQs")
-    
-    def test_addons_endpoint(self, api_client):
-        """Test GET /api/addons"""
-        response = api_client.get(f"{BASE_URL}/api/addons")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        # Verify addon structure
-        for addon in data[:2]:
-            assert "id" in addon
-            assert "name" in addon
-            assert "price" in addon
-        print(f"✓ Addons endpoint returned {len(data)} addons")
-    
-    def test_booking_settings_endpoint(self, api_client):
-        """Test GET /api/booking-settings"""
-        response = api_client.get(f"{BASE_URL}/api/booking-settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert "id" in data
-        assert "time_slot_schedule" in data or "time_slots" in data
-        print("✓ Booking settings endpoint working")
-    
-    def test_contract_endpoint(self, api_client):
-        """Test GET /api/contract"""
-        response = api_client.get(f"{BASE_URL}/api/contract")
-        assert response.status_code == 200
-        data = response.json()
-        assert "id" in data
-        assert "title" in data or "content" in data
-        print("✓ Contract endpoint working")
-    
-    def test_payment_settings_endpoint(self, api_client):
-        """Test GET /api/payments/settings"""
-        response = api_client.get(f"{BASE_URL}/api/payments/settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert "payfast_enabled" in data
-        print("✓ Payment settings endpoint working")
-    
-    def test_instagram_feed_endpoint(self, api_client):
-        """Test GET /api/instagram/feed"""
-        response = api_client.get(f"{BASE_URL}/api/instagram/feed")
-        assert response.status_code == 200
-        data = response.json()
-        # May have posts or error if not configured
-        assert "posts" in data or "error" in data
-        print("✓ Instagram feed endpoint working")
-    
-    def test_google_reviews_public_endpoint(self, api_client):
-        """Test GET /api/google-reviews/public"""
-        response = api_client.get(f"{BASE_URL}/api/google-reviews/public")
-        assert response.status_code == 200
-        data = response.json()
-        assert "reviews" in data
-        print("✓ Google reviews public endpoint working")
+@pytest.mark.slow
+@pytest.mark.parametrize("path,validator", PUBLIC_GET_CASES, ids=[path for path, _ in PUBLIC_GET_CASES])
+def test_public_get(api_client, path, validator):
+    """Public (unauthenticated) GET returns 200 with the expected shape"""
+    _check_get(api_client, path, validator)
 
 
 # ==================== ADMIN AUTHENTICATION ====================
@@ -172,12 +147,12 @@ class TestAdminAuth:
     
     def test_admin_login_success(self, api_client):
         """Test POST /api/admin/login with valid credentials"""
-        response = api_client.post(f"{BASE_URL}/api/admin/login", json={
+        response = api_client.post(EP.admin_login, json={
             "email": ADMIN_EMAIL,
             "password": ADMIN_PASSWORD
         })
         assert response.status_code == 200
-        data = response.json()
+        data = loads(response.content)
         assert "token" in data
         assert "name" in data
         assert "email" in data
@@ -186,7 +161,7 @@ class TestAdminAuth:
     
     def test_admin_login_invalid_credentials(self, api_client):
         """Test POST /api/admin/login with invalid credentials"""
-        response = api_client.post(f"{BASE_URL}/api/admin/login", json={
+        response = api_client.post(EP.admin_login, json={
             "email": "wrong@example.com",
             "password": "wrongpassword"
         })
@@ -196,133 +171,11 @@ class TestAdminAuth:
 
 # ==================== ADMIN AUTHENTICATED ENDPOINTS ====================
 
-class TestAdminEndpoints:
-    """Tests for admin endpoints requiring authentication"""
-    
-    def test_admin_stats(self, authenticated_client):
-        """Test GET /api/admin/stats"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/stats")
-        assert response.status_code == 200
-        data = response.json()
-        assert "total_bookings" in data
-        assert "pending_bookings" in data
-        assert "confirmed_bookings" in data
-        assert "portfolio_count" in data
-        print(f"✓ Admin stats: {data['total_bookings']} total bookings")
-    
-    def test_admin_bookings(self, authenticated_client):
-        """Test GET /api/admin/bookings"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/bookings")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        print(f"✓ Admin bookings returned {len(data)} bookings")
-    
-    def test_admin_packages(self, authenticated_client):
-        """Test GET /api/admin/packages"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/packages")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
-        print(f"✓ Admin packages returned {len(data)} packages")
-    
-    def test_admin_portfolio(self, authenticated_client):
-        """Test GET /api/admin/portfolio"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/portfolio")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        print(f"✓ Admin portfolio returned {len(data)} items")
-    
-    def test_admin_testimonials(self, authenticated_client):
-        """Test GET /api/admin/testimonials"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/testimonials")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        print(f"✓ Admin testimonials returned {len(data)} items")
-    
-    def test_admin_email_settings(self, authenticated_client):
-        """Test GET /api/admin/email-settings"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/email-settings")
-        assert response.status_code == 200
-        data = response.json()
-        # May be empty or have provider info
-        assert isinstance(data, dict)
-        print("✓ Admin email settings endpoint working")
-    
-    def test_admin_payment_settings(self, authenticated_client):
-        """Test GET /api/admin/payment-settings"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/payment-settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, dict)
-        print("✓ Admin payment settings endpoint working")
-    
-    def test_admin_contract(self, authenticated_client):
-        """Test GET /api/admin/contract"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/contract")
-        assert response.status_code == 200
-        data = response.json()
-        assert "id" in data
-        print("✓ Admin contract endpoint working")
-    
-    def test_admin_booking_settings(self, authenticated_client):
-        """Test GET /api/admin/booking-settings"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/booking-settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert "id" in data
-        print("✓ Admin booking settings endpoint working")
-    
-    def test_admin_faqs(self, authenticated_client):
-        """Test GET /api/admin/faqs"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/faqs")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        print(f"✓ Admin FAQs returned {len(data)} items")
-    
-    def test_admin_questionnaires(self, authenticated_client):
-        """Test GET /api/admin/questionnaires"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/questionnaires")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        print(f"✓ Admin questionnaires returned {len(data)} items")
-    
-    def test_admin_email_templates(self, authenticated_client):
-        """Test GET /api/admin/email-templates"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/email-templates")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        print(f"✓ Admin email templates returned {len(data)} items")
-    
-    def test_admin_storage_settings(self, authenticated_client):
-        """Test GET /api/admin/storage-settings"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/storage-settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, dict)
-        print("✓ Admin storage settings endpoint working")
-    
-    def test_admin_instagram_settings(self, authenticated_client):
-        """Test GET /api/admin/instagram-settings"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/instagram-settings")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, dict)
-        print("✓ Admin instagram settings endpoint working")
-    
-    def test_admin_automated_reminders(self, authenticated_client):
-        """Test GET /api/admin/automated-reminders"""
-        response = authenticated_client.get(f"{BASE_URL}/api/admin/automated-reminders")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
-        print(f"✓ Admin automated reminders returned {len(data)} items")
+@pytest.mark.slow
+@pytest.mark.parametrize("path,validator", ADMIN_GET_CASES, ids=[path for path, _ in ADMIN_GET_CASES])
+def test_admin_get(authenticated_client, path, validator):
+    """Admin GET returns 200 with the expected shape"""
+    _check_get(authenticated_client, path, validator)
 
 
 # ==================== CRON ENDPOINTS ====================
@@ -331,10 +184,11 @@ class TestCronEndpoints:
     """Tests for cron/scheduler endpoints"""
     
     def test_process_reminders(self, api_client):
-        """Test POST /api/cron/process-reminders"""
-        response = api_client.post(f"{BASE_URL}/api/cron/process-reminders")
-        assert response.status_code == 200
-        data = response.json()
+        """Test POST /api/cron/process-reminders (queued, so the test doesn't wait on the email sends)"""
+        response = api_client.post(EP.process_reminders, params={"async": 1})
+        # 200 when no reminders are configured and there is nothing to queue
+        assert response.status_code in (200, 202)
+        data = loads(response.content)
         assert "message" in data
         print("✓ Cron process reminders endpoint working")
 
@@ -1,52 +1,91 @@
+import json
+import os
 import requests
 import sys
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json parses the same bytes
+    _loads = json.loads
+
+# Same host and env variable as backend/tests, so both suites exercise one backend
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://photo-biz-hub-3.preview.emergentagent.com').rstrip('/')
+
+# Server-side latency budgets (response.elapsed, ms) keyed by endpoint without query; unlisted paths get the default.
+# Opt-in with LATENCY_BUDGETS=1, since the remote preview host is too jittery to enforce them on every run
+ENFORCE_LATENCY_BUDGETS = os.environ.get("LATENCY_BUDGETS") == "1"
+DEFAULT_LATENCY_BUDGET_MS = 2000
+LATENCY_BUDGETS_MS = {
+    "health": 500,
+    "packages": 1000,
+    "portfolio": 1500,
+    "testimonials": 1000,
+    "admin/me": 500,
+    "admin/login": 1500,
+}
 
 class SilwerLiningAPITester:
-    def __init__(self, base_url="https://photo-biz-hub-3.preview.emergentagent.com/api"):
+    def __init__(self, base_url=f"{BASE_URL}/api"):
         self.base_url = base_url
         self.admin_token = None
         self.tests_run = 0
         self.tests_passed = 0
         self.failed_tests = []
+        # One entry per request; the report is rendered from these once, at the end of main
+        self.results = []
+        self.section = ""
+        self._lock = threading.Lock()
+        self._current = threading.local()
+        # One keep-alive session for every call; retries cover dropped connections and gateway errors
+        # on idempotent methods, and the last gateway response is returned so the report shows the real status
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        retry = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
-        """Run a single API test"""
+    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, check_body=True):
+        """Run a single API test; with check_body=False only the status is checked and the body is not parsed"""
         url = f"{self.base_url}/{endpoint}"
-        test_headers = {'Content-Type': 'application/json'}
-        
-        if headers:
-            test_headers.update(headers)
-        
-        if self.admin_token and 'Authorization' not in test_headers:
-            test_headers['Authorization'] = f'Bearer {self.admin_token}'
-
-        self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        print(f"   URL: {url}")
-        
+
+        result = {"name": name, "section": self.section, "method": method, "url": url,
+                  "status": None, "elapsed_ms": None, "ok": False, "notes": []}
+        self._current.result = result
+        with self._lock:
+            self.tests_run += 1
+            self.results.append(result)
+
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=10)
+            response = self.session.request(method, url, json=data, headers=headers, timeout=10)
+            result["status"] = response.status_code
+            result["elapsed_ms"] = response.elapsed.total_seconds() * 1000
 
             success = response.status_code == expected_status
             if success:
-                self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
-                try:
-                    return True, response.json() if response.content else {}
-                except:
-                    return True, {}
+                # Only JSON bodies are parsed; a malformed one fails the check through the except below
+                body = {}
+                if check_body and response.content and response.headers.get('Content-Type', '').startswith('application/json'):
+                    body = _loads(response.content)
+                budget_ms = LATENCY_BUDGETS_MS.get(endpoint.split("?")[0], DEFAULT_LATENCY_BUDGET_MS)
+                if ENFORCE_LATENCY_BUDGETS and result["elapsed_ms"] > budget_ms:
+                    result["error"] = f"Took {result['elapsed_ms']:.0f} ms (budget {budget_ms} ms)"
+                    self.failed_tests.append({"test": name, "error": result["error"]})
+                    # Still hand back the body so later steps (the login token) can use it
+                    return False, body
+                result["ok"] = True
+                with self._lock:
+                    self.tests_passed += 1
+                return True, body
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
-                print(f"   Response: {response.text[:200]}...")
+                result["error"] = f"Expected {expected_status}, got {response.status_code}"
+                result["notes"].append(f"Response: {response.text[:200]}...")
                 self.failed_tests.append({
                     "test": name,
                     "expected": expected_status,
@@ -56,22 +95,56 @@ class SilwerLiningAPITester:
                 return False, {}
 
         except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
+            result["error"] = f"Error: {str(e)}"
             self.failed_tests.append({
                 "test": name,
                 "error": str(e)
             })
             return False, {}
 
+    def note(self, text):
+        """Attach a detail line to the result of the last run_test call on this thread"""
+        self._current.result["notes"].append(text)
+
+    def skip(self, name, reason):
+        """Record a check that could not be sent, without counting it as run"""
+        with self._lock:
+            self.results.append({"name": name, "section": self.section, "method": None, "url": None,
+                                 "status": None, "elapsed_ms": None, "ok": False, "error": reason, "notes": []})
+        return False
+
+    def render_results(self):
+        """Report lines for every recorded result, grouped under their section headings"""
+        lines = []
+        section = None
+        for result in self.results:
+            if result["section"] != section:
+                section = result["section"]
+                lines.append(f"\n{section}")
+            lines.append(f"\n🔍 Testing {result['name']}...")
+            if result["url"]:
+                lines.append(f"   URL: {result['method']} {result['url']}")
+            if result["ok"]:
+                lines.append(f"✅ Passed - Status: {result['status']} ({result['elapsed_ms']:.0f} ms)")
+            else:
+                lines.append(f"❌ Failed - {result['error']}")
+            lines.extend(f"   {note}" for note in result["notes"])
+        return lines
+
+    def run_concurrently(self, *checks):
+        """Run independent read-only checks at once; they share the session's connection pool"""
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            return list(pool.map(lambda check: check(), checks))
+
     def test_health_check(self):
         """Test basic health endpoint"""
-        return self.run_test("Health Check", "GET", "health", 200)
+        return self.run_test("Health Check", "GET", "health", 200, check_body=False)
 
     def test_packages_endpoint(self):
         """Test packages endpoint and verify ZAR pricing"""
         success, response = self.run_test("Get Packages", "GET", "packages", 200)
         if success and response:
-            print(f"   Found {len(response)} packages")
+            self.note(f"Found {len(response)} packages")
             
             # Verify ZAR pricing for maternity packages
             maternity_packages = [p for p in response if p.get('session_type') == 'maternity']
@@ -79,14 +152,14 @@ class SilwerLiningAPITester:
             
             if maternity_packages:
                 actual_prices = [p.get('price') for p in maternity_packages]
-                print(f"   Maternity package prices (ZAR): {actual_prices}")
+                self.note(f"Maternity package prices (ZAR): {actual_prices}")
                 
                 # Check if we have the expected ZAR prices
                 matching_prices = [p for p in actual_prices if p in expected_zar_prices]
                 if len(matching_prices) >= 2:  # At least 2 of the expected prices
-                    print("   ✅ ZAR pricing confirmed for maternity packages")
+                    self.note("✅ ZAR pricing confirmed for maternity packages")
                 else:
-                    print(f"   ❌ Expected ZAR prices {expected_zar_prices}, got {actual_prices}")
+                    self.note(f"❌ Expected ZAR prices {expected_zar_prices}, got {actual_prices}")
                     self.failed_tests.append({
                         "test": "ZAR Pricing Verification",
                         "error": f"Expected ZAR prices {expected_zar_prices}, got {actual_prices}"
@@ -98,21 +171,21 @@ class SilwerLiningAPITester:
                 required_fields = ['id', 'name', 'session_type', 'price', 'duration', 'includes']
                 missing_fields = [field for field in required_fields if field not in pkg]
                 if missing_fields:
-                    print(f"   ⚠️  Missing fields in package: {missing_fields}")
+                    self.note(f"⚠️  Missing fields in package: {missing_fields}")
         return success
 
     def test_portfolio_endpoint(self):
         """Test portfolio endpoint"""
         success, response = self.run_test("Get Portfolio", "GET", "portfolio", 200)
         if success:
-            print(f"   Found {len(response)} portfolio items")
+            self.note(f"Found {len(response)} portfolio items")
         return success
 
     def test_testimonials_endpoint(self):
         """Test testimonials endpoint"""
         success, response = self.run_test("Get Testimonials", "GET", "testimonials", 200)
         if success:
-            print(f"   Found {len(response)} testimonials")
+            self.note(f"Found {len(response)} testimonials")
         return success
 
     def test_available_times(self):
@@ -125,7 +198,7 @@ class SilwerLiningAPITester:
             200
         )
         if success and response:
-            print(f"   Available times for {tomorrow}: {len(response.get('available_times', []))}")
+            self.note(f"Available times for {tomorrow}: {len(response.get('available_times', []))}")
         return success
 
     def test_contact_submission(self):
@@ -145,7 +218,7 @@ class SilwerLiningAPITester:
             data=contact_data
         )
         if success and response:
-            print(f"   Contact message ID: {response.get('id', 'N/A')}")
+            self.note(f"Contact message ID: {response.get('id', 'N/A')}")
         return success
 
     def test_booking_creation(self):
@@ -169,7 +242,7 @@ class SilwerLiningAPITester:
             data=booking_data
         )
         if success and response:
-            print(f"   Booking ID: {response.get('id', 'N/A')}")
+            self.note(f"Booking ID: {response.get('id', 'N/A')}")
             return response.get('id')
         return None
 
@@ -185,7 +258,8 @@ class SilwerLiningAPITester:
             "POST", 
             "admin/setup", 
             200, 
-            data=admin_data
+            data=admin_data,
+            check_body=False
         )
         return success
 
@@ -202,123 +276,128 @@ class SilwerLiningAPITester:
             200, 
             data=login_data
         )
-        if success and response:
+        # A slow but successful login still returns its body, so the token is kept either way
+        if response:
             self.admin_token = response.get('token')
-            print(f"   Admin logged in: {response.get('name', 'N/A')}")
+            # Every later call is an admin call, so the session carries the token from here on
+            if self.admin_token:
+                self.session.headers['Authorization'] = f'Bearer {self.admin_token}'
+            self.note(f"Admin logged in: {response.get('name', 'N/A')}")
         return success
 
     def test_admin_me(self):
         """Test admin me endpoint"""
         if not self.admin_token:
-            print("❌ No admin token available")
-            return False
-        
+            return self.skip("Admin Me", "No admin token available")
+
         success, response = self.run_test("Admin Me", "GET", "admin/me", 200)
         if success and response:
-            print(f"   Admin info: {response.get('name', 'N/A')} ({response.get('email', 'N/A')})")
+            self.note(f"Admin info: {response.get('name', 'N/A')} ({response.get('email', 'N/A')})")
         return success
 
     def test_admin_bookings(self):
         """Test admin bookings endpoint"""
         if not self.admin_token:
-            print("❌ No admin token available")
-            return False
-        
+            return self.skip("Admin Get Bookings", "No admin token available")
+
         success, response = self.run_test("Admin Get Bookings", "GET", "admin/bookings", 200)
         if success:
-            print(f"   Found {len(response)} bookings")
+            self.note(f"Found {len(response)} bookings")
         return success
 
     def test_admin_portfolio(self):
         """Test admin portfolio endpoint"""
         if not self.admin_token:
-            print("❌ No admin token available")
-            return False
-        
+            return self.skip("Admin Get Portfolio", "No admin token available")
+
         success, response = self.run_test("Admin Get Portfolio", "GET", "admin/portfolio", 200)
         if success:
-            print(f"   Found {len(response)} portfolio items")
+            self.note(f"Found {len(response)} portfolio items")
         return success
 
     def test_admin_testimonials(self):
         """Test admin testimonials endpoint"""
         if not self.admin_token:
-            print("❌ No admin token available")
-            return False
-        
+            return self.skip("Admin Get Testimonials", "No admin token available")
+
         success, response = self.run_test("Admin Get Testimonials", "GET", "admin/testimonials", 200)
         if success:
-            print(f"   Found {len(response)} testimonials")
+            self.note(f"Found {len(response)} testimonials")
         return success
 
     def test_admin_messages(self):
         """Test admin messages endpoint"""
         if not self.admin_token:
-            print("❌ No admin token available")
-            return False
-        
+            return self.skip("Admin Get Messages", "No admin token available")
+
         success, response = self.run_test("Admin Get Messages", "GET", "admin/messages", 200)
         if success:
-            print(f"   Found {len(response)} messages")
+            self.note(f"Found {len(response)} messages")
         return success
 
     def test_admin_stats(self):
         """Test admin stats endpoint"""
         if not self.admin_token:
-            print("❌ No admin token available")
-            return False
-        
+            return self.skip("Admin Get Stats", "No admin token available")
+
         success, response = self.run_test("Admin Get Stats", "GET", "admin/stats", 200)
         if success and response:
             stats = [f"{k}: {v}" for k, v in response.items()]
-            print(f"   Stats: {', '.join(stats)}")
+            self.note(f"Stats: {', '.join(stats)}")
         return success
 
 def main():
-    print("🚀 Starting Silwer Lining Photography API Tests")
-    print("=" * 60)
-    
     tester = SilwerLiningAPITester()
     
     # Test public endpoints
-    print("\n📋 Testing Public Endpoints...")
-    tester.test_health_check()
-    tester.test_packages_endpoint()
-    tester.test_portfolio_endpoint()
-    tester.test_testimonials_endpoint()
-    tester.test_available_times()
+    tester.section = "📋 Testing Public Endpoints..."
+    tester.run_concurrently(
+        tester.test_health_check,
+        tester.test_packages_endpoint,
+        tester.test_portfolio_endpoint,
+        tester.test_testimonials_endpoint,
+        tester.test_available_times,
+    )
     tester.test_contact_submission()
     booking_id = tester.test_booking_creation()
     
     # Test admin endpoints
-    print("\n🔐 Testing Admin Endpoints...")
+    tester.section = "🔐 Testing Admin Endpoints..."
     # Try setup first (might fail if admin exists)
     tester.test_admin_setup()
     
     # Login and test authenticated endpoints
-    if tester.test_admin_login():
-        tester.test_admin_me()
-        tester.test_admin_bookings()
-        tester.test_admin_portfolio()
-        tester.test_admin_testimonials()
-        tester.test_admin_messages()
-        tester.test_admin_stats()
+    tester.test_admin_login()
+    if tester.admin_token:
+        tester.run_concurrently(
+            tester.test_admin_me,
+            tester.test_admin_bookings,
+            tester.test_admin_portfolio,
+            tester.test_admin_testimonials,
+            tester.test_admin_messages,
+            tester.test_admin_stats,
+        )
+    
+    tester.session.close()
     
-    # Print results
-    print("\n" + "=" * 60)
-    print(f"📊 Test Results: {tester.tests_passed}/{tester.tests_run} passed")
+    # Build the whole report and write it once
+    report = ["🚀 Starting Silwer Lining Photography API Tests", "=" * 60]
+    report.extend(tester.render_results())
+    report.append("\n" + "=" * 60)
+    report.append(f"📊 Test Results: {tester.tests_passed}/{tester.tests_run} passed")
     
     if tester.failed_tests:
-        print(f"\n❌ Failed Tests ({len(tester.failed_tests)}):")
+        report.append(f"\n❌ Failed Tests ({len(tester.failed_tests)}):")
         for i, test in enumerate(tester.failed_tests, 1):
-            print(f"   {i}. {test.get('test', 'Unknown')}")
+            report.append(f"   {i}. {test.get('test', 'Unknown')}")
             if 'error' in test:
-                print(f"      Error: {test['error']}")
+                report.append(f"      Error: {test['error']}")
             else:
-                print(f"      Expected: {test.get('expected')}, Got: {test.get('actual')}")
+                report.append(f"      Expected: {test.get('expected')}, Got: {test.get('actual')}")
     
     success_rate = (tester.tests_passed / tester.tests_run) * 100 if tester.tests_run > 0 else 0
-    print(f"\n🎯 Success Rate: {success_rate:.1f}%")
+    report.append(f"\n🎯 Success Rate: {success_rate:.1f}%")
+    sys.stdout.write("\n".join(report) + "\n")
     
     return 0 if success_rate >= 80 else 1
 